@@ -1,22 +1,55 @@
 from __future__ import annotations
 
-import argparse
+import functools
 import os
 import shutil
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .installer import data_root, default_install_dir, install_binary
 
+if TYPE_CHECKING:
+    import argparse
+
+
+def _norm(p: str) -> str:
+    return os.path.normcase(os.path.normpath(p))
+
+
+@functools.lru_cache(maxsize=8)
+def _path_entries(path: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    # keyed on the PATH string itself, so a changed PATH is simply a new entry
+    parts = tuple(p.strip() for p in path.split(os.pathsep) if p.strip())
+    return parts, frozenset(_norm(p) for p in parts)
+
 
 def _on_path(dir_: Path) -> bool:
-    path = os.environ.get("PATH", "")
-    parts = [p.strip() for p in path.split(os.pathsep) if p.strip()]
-    norm = {str(Path(p).resolve()) for p in parts}
+    parts, normalized = _path_entries(os.environ.get("PATH", ""))
+    # fast path: pure string normalization, no filesystem access
+    if _norm(str(dir_)) in normalized:
+        return True
+    # an entry may name the same directory through a symlink: compare
+    # (st_dev, st_ino), one stat per entry instead of resolve()'s readlink walk
     try:
-        return str(dir_.resolve()) in norm
-    except Exception:
-        return str(dir_) in parts
+        st = os.stat(dir_)
+    except (OSError, ValueError):
+        return False
+    if not st.st_ino:
+        # no usable file identity on this filesystem
+        return False
+    for p in parts:
+        try:
+            entry = os.stat(p)
+        except (OSError, ValueError):
+            continue
+        if (entry.st_dev, entry.st_ino) == (st.st_dev, st.st_ino):
+            return True
+    return False
+
+
+def _binary_name() -> str:
+    return "neo4j-mcp.exe" if os.name == "nt" else "neo4j-mcp"
 
 
 def _print_path_help(install_dir: Path) -> None:
@@ -28,7 +61,10 @@ def _print_path_help(install_dir: Path) -> None:
         print('  export PATH="$HOME/.local/bin:$PATH"\n')
 
 
-def main() -> None:
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="neo4j-mcp-installer",
         description="Installer for the Neo4j MCP server binary (no launcher shim).",
@@ -52,30 +88,44 @@ def main() -> None:
     p_uninstall.add_argument("--install-dir", help="Custom install directory where the binary was placed.")
     p_uninstall.add_argument("--clean-cache", action="store_true", help="Also remove downloaded archives and cached versions.")
 
-    args = parser.parse_args()
+    return parser
+
+
+def _uninstall(install_dir: Path, clean_cache: bool) -> None:
+    path = install_dir / _binary_name()
+    if path.exists():
+        path.unlink()
+        print(f"Removed: {path}")
+    else:
+        print(f"Not found: {path}")
+    
+    if clean_cache:
+        cache_dir = data_root()
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+            print(f"Removed cache: {cache_dir}")
+        else:
+            print(f"Cache not found: {cache_dir}")
+
+
+def main() -> None:
+    # bare `where` / `uninstall` are the hot paths for scripts: answer them without argparse
+    if sys.argv[1:] == ["where"]:
+        print(str(default_install_dir() / _binary_name()))
+        return
+    if sys.argv[1:] == ["uninstall"]:
+        _uninstall(default_install_dir(), clean_cache=False)
+        return
+
+    args = _get_parser().parse_args()
     install_dir = Path(args.install_dir) if getattr(args, "install_dir", None) else default_install_dir()
 
     if args.cmd == "where":
-        name = "neo4j-mcp.exe" if os.name == "nt" else "neo4j-mcp"
-        print(str(install_dir / name))
+        print(str(install_dir / _binary_name()))
         return
 
     if args.cmd == "uninstall":
-        name = "neo4j-mcp.exe" if os.name == "nt" else "neo4j-mcp"
-        path = install_dir / name
-        if path.exists():
-            path.unlink()
-            print(f"Removed: {path}")
-        else:
-            print(f"Not found: {path}")
-        
-        if args.clean_cache:
-            cache_dir = data_root()
-            if cache_dir.exists():
-                shutil.rmtree(cache_dir)
-                print(f"Removed cache: {cache_dir}")
-            else:
-                print(f"Cache not found: {cache_dir}")
+        _uninstall(install_dir, args.clean_cache)
         return
 
     # install/upgrade
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import contextlib
+import errno
+import functools
 import hashlib
+import http.client
 import json
+import mmap
 import os
 import platform
 import re
 import shutil
 import stat
-import tarfile
+import sys
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple
@@ -24,6 +32,34 @@ DEFAULT_BASE_URL = os.environ.get(
 )
 GITHUB_API_LATEST = lambda repo: f"https://api.github.com/repos/{repo}/releases/latest"
 
+# copy/hash buffer size: large enough that per-chunk Python overhead is noise
+_CHUNK_SIZE = 1024 * 1024
+
+# files above this are hashed through mmap; smaller ones with a single read,
+# where setting up the mapping costs more than it saves
+_MMAP_HASH_THRESHOLD = 1024 * 1024
+
+# downloads larger than this are split into parallel Range requests
+_SEGMENT_THRESHOLD = 8 * 1024 * 1024
+_MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+_MAX_SEGMENTS = 4
+
+# one checksums.txt entry per match: "<sha> [...] [*]<filename>" on one line, or
+# a filename line followed by "sha256:<sha>" (blank lines in between are ok)
+_CHECKSUM_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<hash>[0-9a-fA-F]{64})[^\S\n]+(?:\S+[^\S\n]+)*\*?(?P<file>\S+)"
+    r"|(?!sha256:)(?P<block_file>\S+)\s*?\n\s*sha256:(?P<block_hash>[0-9a-fA-F]{64})"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
+_MAX_AGE_RE = re.compile(r"(?<![-\w])max-age\s*=\s*(\d+)")
+
+# a "tag_name" key with a plain (escape-free) string value; quotes inside other
+# JSON strings are backslash-escaped, so release notes can't produce a match
+_TAG_NAME_RE = re.compile(rb'"tag_name"\s*:\s*"([^"\\]+)"')
+
 
 @dataclass(frozen=True)
 class Target:
@@ -31,36 +67,50 @@ class Target:
     arch: str           # arm64 | x86_64 | i386
     archive_ext: str    # .tar.gz | .zip
 
-    @property
+    # detect_target hands out one shared instance, so each name is built once;
+    # cached_property writes __dict__ directly, which frozen dataclasses allow
+    @functools.cached_property
     def asset_name(self) -> str:
         return f"neo4j-mcp_{self.os_name}_{self.arch}{self.archive_ext}"
 
-    @property
+    @functools.cached_property
     def extracted_binary_name(self) -> str:
         return "neo4j-mcp.exe" if self.os_name == "Windows" else "neo4j-mcp"
 
 
-def detect_target() -> Target:
-    sysname = platform.system()  # "Darwin", "Linux", "Windows"
-    machine = platform.machine().lower()
+# release archive format per supported platform.system()
+_ARCHIVE_EXTS = {"Darwin": ".tar.gz", "Linux": ".tar.gz", "Windows": ".zip"}
 
-    if sysname not in ("Darwin", "Linux", "Windows"):
-        raise RuntimeError(f"Unsupported OS: {sysname}")
+# lower-cased platform.machine() -> release arch name
+_ARCHES = {
+    "arm64": "arm64",
+    "aarch64": "arm64",
+    "x86_64": "x86_64",
+    "amd64": "x86_64",
+    "i386": "i386",
+    "i686": "i386",
+    "x86": "i386",
+}
 
-    archive_ext = ".zip" if sysname == "Windows" else ".tar.gz"
 
-    if machine in ("arm64", "aarch64"):
-        arch = "arm64"
-    elif machine in ("x86_64", "amd64"):
-        arch = "x86_64"
-    elif machine in ("i386", "i686", "x86"):
-        arch = "i386"
-    else:
-        raise RuntimeError(f"Unsupported architecture: {platform.machine()}")
+@functools.cache
+def detect_target() -> Target:
+    sysname = platform.system()  # "Darwin", "Linux", "Windows"
+    machine = platform.machine()
+
+    try:
+        archive_ext = _ARCHIVE_EXTS[sysname]
+    except KeyError:
+        raise RuntimeError(f"Unsupported OS: {sysname}") from None
+    try:
+        arch = _ARCHES[machine.lower()]
+    except KeyError:
+        raise RuntimeError(f"Unsupported architecture: {machine}") from None
 
     return Target(os_name=sysname, arch=arch, archive_ext=archive_ext)
 
 
+@functools.cache
 def data_root() -> Path:
     # per-user *data* dir (not cache) because we want the installed binary to persist
     # Linux: ~/.local/share/neo4j-mcp
@@ -69,6 +119,7 @@ def data_root() -> Path:
     return Path(user_data_dir("neo4j-mcp"))
 
 
+@functools.cache
 def versions_dir() -> Path:
     return data_root() / "versions"
 
@@ -85,6 +136,19 @@ def extracted_path(version: str, target: Target) -> Path:
     return version_dir(version) / target.extracted_binary_name
 
 
+def http_cache_dir() -> Path:
+    return data_root() / "cache"
+
+
+def checksum_cache_dir() -> Path:
+    return data_root() / "checksums"
+
+
+def install_record_dir() -> Path:
+    return data_root() / "installed"
+
+
+@functools.cache
 def default_install_dir() -> Path:
     if os.name == "nt":
         local = os.environ.get("LOCALAPPDATA")
@@ -94,31 +158,597 @@ def default_install_dir() -> Path:
     return Path.home() / ".local" / "bin"
 
 
-def _http_get_bytes(url: str, headers: Optional[dict[str, str]] = None) -> bytes:
-    req = urllib.request.Request(url, headers=headers or {})
-    with urllib.request.urlopen(req, timeout=60) as resp:
+# None until _pool() first runs; False once it has found urllib3 missing
+_POOL = None
+# optional: pip install "neo4j-mcp-installer[fast]"; imported by _pool() on first use
+urllib3 = None
+
+# same limit as urllib's HTTPRedirectHandler
+_MAX_REDIRECTS = 10
+
+
+def _pool():
+    """
+    Returns the shared urllib3 PoolManager, or None if urllib3 isn't installed
+    or a proxy is configured (PoolManager ignores HTTP(S)_PROXY; urllib honours it).
+
+    One pool keeps TLS connections to api.github.com and the release CDN warm
+    across the several requests made by a single install. urllib3 is imported
+    here, on first use, so commands that never touch the network don't pay for it.
+    """
+    global _POOL, urllib3
+    if urllib.request.getproxies():
+        return None
+    if _POOL is None:
+        try:
+            import urllib3
+        except ImportError:
+            _POOL = False
+        else:
+            _POOL = urllib3.PoolManager(maxsize=4, retries=urllib3.util.Retry(3, backoff_factor=0.3))
+    return _POOL or None
+
+
+# per-thread {(scheme, netloc): connection} for the stdlib keep-alive path;
+# segmented downloads issue requests from several threads at once
+_CONNS = threading.local()
+
+
+def _can_keep_alive(url: str) -> bool:
+    # http.client knows nothing about proxies; proxied setups stay on urllib
+    return urllib.parse.urlsplit(url).scheme in ("http", "https") and not urllib.request.getproxies()
+
+
+def _keepalive_request(scheme: str, netloc: str, path: str, headers: dict[str, str]):
+    conns = getattr(_CONNS, "by_host", None)
+    if conns is None:
+        conns = _CONNS.by_host = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conns[(scheme, netloc)] = cls(netloc, timeout=60)
+
+    for attempt in (0, 1):
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except (OSError, http.client.HTTPException) as e:
+            # close() also lets the next request() reconnect
+            conn.close()
+            # a kept-alive connection the server has since dropped: retry once
+            if not (reused and attempt == 0 and isinstance(e, (ConnectionError, http.client.BadStatusLine))):
+                raise urllib.error.URLError(e) from e
+
+
+@contextlib.contextmanager
+def _keepalive_urlopen(url: str, headers: dict[str, str]):
+    """
+    GETs url over a persistent http.client connection per host, so the
+    several requests an install makes share TCP / TLS handshakes even
+    without urllib3. Redirects are followed here, as urlopen would.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn, resp = _keepalive_request(parts.scheme, parts.netloc, path, headers)
+        location = resp.getheader("Location")
+        if resp.status not in (301, 302, 303, 307, 308) or not location:
+            break
+        # drain the (small) redirect body so the connection can be reused
+        resp.read()
+        url = urllib.parse.urljoin(url, location)
+    try:
+        if resp.status >= 300:
+            resp.read()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        # http.client leaves .url (and so .geturl()) to urllib; callers expect the final URL
+        resp.url = url
+        yield resp
+    finally:
+        if not resp.isclosed():
+            # body left unread: the connection can't carry another request
+            conn.close()
+
+
+@contextlib.contextmanager
+def _urlopen(url: str, headers: dict[str, str]):
+    """
+    Opens url through the shared pool when available, else over a stdlib
+    keep-alive connection, else (behind a proxy) plain urllib.
+
+    Either way the response has .status, .headers, .read() and .readinto(),
+    and failures surface as urllib.error.HTTPError / URLError so callers
+    only handle one set of exceptions.
+    """
+    pool = _pool()
+    if pool is None:
+        if _can_keep_alive(url):
+            with _keepalive_urlopen(url, headers) as resp:
+                yield resp
+            return
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            yield resp
+        return
+
+    try:
+        resp = pool.request("GET", url, headers=headers, preload_content=False, timeout=60)
+    except urllib3.exceptions.HTTPError as e:
+        raise urllib.error.URLError(e) from e
+    try:
+        # redirects are followed by the pool; like urllib, treat anything else non-2xx as an error
+        if resp.status >= 300:
+            resp.drain_conn()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        yield resp
+    finally:
+        resp.release_conn()
+
+
+def _http_get_bytes(
+    url: str,
+    headers: Optional[dict[str, str]] = None,
+    response_headers: Optional[dict[str, str]] = None,
+) -> bytes:
+    # response_headers, if given, is filled with the (lower-cased) response headers
+    with _urlopen(url, headers or {}) as resp:
+        if response_headers is not None:
+            response_headers.update((k.lower(), v) for k, v in resp.headers.items())
         return resp.read()
 
 
-def _http_download(url: str, dest: Path, headers: Optional[dict[str, str]] = None) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    req = urllib.request.Request(url, headers=headers or {})
-    with urllib.request.urlopen(req, timeout=60) as resp, open(dest, "wb") as f:
-        while True:
-            chunk = resp.read(1024 * 1024)
-            if not chunk:
-                break
-            f.write(chunk)
+def _fresh_until(cache_control: str) -> Optional[float]:
+    # epoch time a response may be reused until without asking again, if any
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return None
+    m = _MAX_AGE_RE.search(cache_control)
+    return time.time() + int(m.group(1)) if m and int(m.group(1)) > 0 else None
+
+
+def _write_json_atomic(path: Path, obj) -> None:
+    # for the caches and records under data_root(): they're only an
+    # optimization, so a failed write is dropped rather than failing the install
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(obj), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _http_get_cached(url: str, cache_file: Path, headers: Optional[dict[str, str]] = None) -> bytes:
+    """
+    GETs url, revalidating a previous response stored in cache_file with
+    If-None-Match / If-Modified-Since. A 304 returns the cached body without
+    transferring it again. While the stored response is still fresh per its
+    Cache-Control max-age, no request is made at all.
+    """
+    headers = dict(headers or {})
+    cached: Optional[dict] = None
+    try:
+        obj = json.loads(cache_file.read_bytes())
+        if obj.get("url") == url and isinstance(obj.get("body"), str):
+            cached = obj
+    except (OSError, ValueError):
+        pass
+
+    if cached is not None:
+        expires = cached.get("expires")
+        if isinstance(expires, (int, float)) and time.time() < expires:
+            return cached["body"].encode("utf-8")
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    meta: dict[str, str] = {}
+    try:
+        body = _http_get_bytes(url, headers=headers, response_headers=meta)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached["body"].encode("utf-8")
+        raise
+
+    etag = meta.get("etag")
+    last_modified = meta.get("last-modified")
+    expires = _fresh_until(meta.get("cache-control", ""))
+    if etag or last_modified or expires:
+        record = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires": expires,
+            "body": body.decode("utf-8", errors="replace"),
+        }
+        _write_json_atomic(cache_file, record)
+    return body
+
+
+def _copy_response(resp, f, hasher: Optional[hashlib._Hash] = None) -> int:
+    # readinto a single reusable buffer: no bytes object allocated per chunk.
+    # Returns the number of bytes written.
+    buf = bytearray(_CHUNK_SIZE)
+    view = memoryview(buf)
+    written = 0
+    while True:
+        n = resp.readinto(buf)
+        if not n:
+            break
+        chunk = view[:n]
+        if hasher is not None:
+            hasher.update(chunk)
+        f.write(chunk)
+        written += n
+    return written
+
+
+def _check_length(url: str, start: int, end: int, got: int) -> None:
+    # a body shorter (or longer) than the byte range it was sent for
+    if got != end - start + 1:
+        raise RuntimeError(f"Download of bytes {start}-{end} of {url} ended after {got} of {end - start + 1} bytes")
+
+
+def _partial_content_total(resp) -> Optional[int]:
+    # total size from a "206 Content-Range: bytes 0-N/TOTAL" reply, else None
+    if resp.status != 206:
+        return None
+    m = re.fullmatch(r"bytes 0-(\d+)/(\d+)", str(resp.headers.get("Content-Range", "")).strip())
+    if not m or int(m.group(1)) != min(int(m.group(2)), _SEGMENT_THRESHOLD) - 1:
+        return None
+    return int(m.group(2))
+
+
+def _download_range(url: str, headers: dict[str, str], dest: Path, start: int, end: int, total: int) -> None:
+    with _urlopen(url, {**headers, "Range": f"bytes={start}-{end}"}) as resp, open(dest, "r+b") as f:
+        if resp.status != 206:
+            raise RuntimeError(f"Server ignored Range request for bytes {start}-{end} of {url}")
+        content_range = str(resp.headers.get("Content-Range", "")).strip()
+        if content_range != f"bytes {start}-{end}/{total}":
+            raise RuntimeError(
+                f"Server replied {content_range or 'without Content-Range'} to a request for bytes "
+                f"{start}-{end}/{total} of {url}"
+            )
+        f.seek(start)
+        _check_length(url, start, end, _copy_response(resp, f))
+
+
+def _http_download(
+    url: str,
+    dest: Path,
+    headers: Optional[dict[str, str]] = None,
+    hasher: Optional[hashlib._Hash] = None,
+) -> None:
+    """
+    Streams url to dest, whose parent directory must already exist.
+
+    The first request asks for only the first _SEGMENT_THRESHOLD bytes. A
+    server that honours Range replies 206 with the total size, and anything
+    beyond that is fetched as up to _MAX_SEGMENTS - 1 parallel Range requests
+    while the first segment streams in. Servers that ignore Range reply 200
+    and the whole body is streamed as usual. Any other 206 (a range the server
+    capped, an unknown "/*" total, no usable Content-Range) is only part of the
+    file, so it is dropped and the file fetched again without Range.
+
+    If a hasher is given it is fed the bytes in order: the first segment while
+    it is written, then each tail segment as soon as it has landed, while the
+    later ones are still downloading.
+    """
+    headers = dict(headers or {})
+    first = {**headers, "Range": f"bytes=0-{_SEGMENT_THRESHOLD - 1}"}
+
+    with _urlopen(url, first) as resp:
+        total = _partial_content_total(resp)
+        if resp.status != 206 or total is not None:
+            with open(dest, "wb") as f:
+                _download_segments(url, resp, f, dest, headers, total, hasher)
+            return
+
+    with _urlopen(url, headers) as resp, open(dest, "wb") as f:
+        if resp.status == 206:
+            raise RuntimeError(f"Server sent a partial response to a plain GET for {url}")
+        _copy_response(resp, f, hasher)
+
+
+def _download_segments(
+    url: str,
+    resp,
+    f,
+    dest: Path,
+    headers: dict[str, str],
+    total: Optional[int],
+    hasher: Optional[hashlib._Hash],
+) -> None:
+    # resp answered the first Range request: a 200 (total None) or a usable 206
+    if total is None or total <= _SEGMENT_THRESHOLD:
+        got = _copy_response(resp, f, hasher)
+        if total is not None:
+            _check_length(url, 0, total - 1, got)
+        return
+
+    # preallocate so every segment writes into its final place
+    try:
+        os.posix_fallocate(f.fileno(), 0, total)
+    except (AttributeError, OSError):
+        f.truncate(total)
+
+    rest = total - _SEGMENT_THRESHOLD
+    count = min(_MAX_SEGMENTS - 1, -(-rest // _MIN_SEGMENT_SIZE))
+    step = -(-rest // count)
+    ranges = [
+        (start, min(start + step, total) - 1)
+        for start in range(_SEGMENT_THRESHOLD, total, step)
+    ]
+    # the redirect (if any) is already resolved; segments go straight to the CDN
+    segment_url = urllib.parse.urljoin(url, resp.geturl() or url)
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [pool.submit(_download_range, segment_url, headers, dest, a, b, total) for a, b in ranges]
+        _check_length(url, 0, _SEGMENT_THRESHOLD - 1, _copy_response(resp, f, hasher))
+        for (start, end), fut in zip(ranges, futures):
+            fut.result()
+            if hasher is not None:
+                _hash_range(dest, start, end, hasher)
+
+
+def _hash_range(path: Path, start: int, end: int, hasher: hashlib._Hash) -> None:
+    # the segment was just written, so this reads from the page cache
+    buf = bytearray(_CHUNK_SIZE)
+    view = memoryview(buf)
+    remaining = end - start + 1
+    with open(path, "rb", buffering=0) as f:
+        f.seek(start)
+        while remaining > 0:
+            n = f.readinto(view[:min(remaining, len(buf))])
+            if not n:
+                raise RuntimeError(f"{path.name} ended before byte {end}")
+            hasher.update(view[:n])
+            remaining -= n
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+    # unbuffered: nothing is copied through a BufferedReader on the way
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size <= _MMAP_HASH_THRESHOLD:
+            return hashlib.sha256(f.read()).hexdigest()
+        try:
+            return _sha256_mapped(f)
+        except OSError:
+            # mmap isn't supported everywhere (some network / FUSE mounts)
+            pass
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
             h.update(chunk)
+        return h.hexdigest()
+
+
+def _sha256_mapped(f) -> str:
+    """
+    Hashes an open file by mapping it and handing OpenSSL one contiguous
+    buffer, so the whole range goes through a single update() call.
+    """
+    h = hashlib.sha256()
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h.update(mm)
+    except ValueError:
+        # empty files can't be mapped; their digest is that of b""
+        pass
     return h.hexdigest()
 
 
+def _checksum_cache_file(path: Path) -> Path:
+    key = hashlib.sha256(str(path.absolute()).encode("utf-8")).hexdigest()
+    return checksum_cache_dir() / f"{key}.json"
+
+
+def _crc_recheck() -> bool:
+    # NEO4J_MCP_CACHE_VERIFY=crc32: don't trust mtime + size alone for a cached digest
+    return os.environ.get("NEO4J_MCP_CACHE_VERIFY", "").lower() == "crc32"
+
+
+def _crc32_file(path: Path) -> int:
+    """
+    CRC-32 of a file, through python-isal when it's installed (several times
+    faster than zlib's). Cheaper than rehashing with sha256, and enough to
+    notice corruption: the digest it guards was already checked against
+    checksums.txt, so tampering isn't what it's looking for.
+    """
+    try:
+        from isal.isal_zlib import crc32
+    except ImportError:
+        from zlib import crc32
+    with open(path, "rb", buffering=0) as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return crc32(mm)
+        except ValueError:
+            # empty files can't be mapped
+            return 0
+
+
+def _store_cached_sha256(path: Path, digest: str) -> None:
+    try:
+        st = path.stat()
+        record = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        if _crc_recheck():
+            record["crc32"] = _crc32_file(path)
+    except OSError:
+        return
+    _write_json_atomic(_checksum_cache_file(path), record)
+
+
+def _read_checksum_record(path: Path) -> dict:
+    # path's checksum-cache entry, or {} if there's none (or it's unreadable)
+    try:
+        record = json.loads(_checksum_cache_file(path).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return record if isinstance(record, dict) else {}
+
+
+def _cached_sha256_file(path: Path, record: Optional[dict] = None) -> str:
+    """
+    Like _sha256_file, but remembers the digest under checksum_cache_dir().
+    The entry is only trusted while the file's mtime and size are unchanged,
+    so a re-check of an untouched archive costs a stat() and a small JSON read.
+    With NEO4J_MCP_CACHE_VERIFY=crc32 the file's CRC-32 must still match too.
+    A caller that already has the entry from _read_checksum_record passes it in.
+    """
+    if record is None:
+        record = _read_checksum_record(path)
+    try:
+        st = path.stat()
+        if (
+            record.get("mtime_ns") == st.st_mtime_ns
+            and record.get("size") == st.st_size
+            and isinstance(record.get("sha256"), str)
+            and (not _crc_recheck() or record.get("crc32") == _crc32_file(path))
+        ):
+            return record["sha256"]
+    except OSError:
+        pass
+
+    digest = _sha256_file(path)
+    _store_cached_sha256(path, digest)
+    return digest
+
+
+def _matches_sha256(path: Path, expected: str, *, use_cache: bool = True) -> bool:
+    """
+    Whether path hashes to expected, via _cached_sha256_file. If the cache
+    says path matched expected back when it had a different size, it can't
+    match now, and the file isn't read at all (pkg(8)'s size-before-hash check).
+
+    use_cache=False (a forced reinstall, which is how a corrupted cache gets
+    repaired) always reads and hashes the file, and refreshes the entry.
+    """
+    expected = expected.lower()
+    if not use_cache:
+        digest = _sha256_file(path)
+        _store_cached_sha256(path, digest)
+        return digest == expected
+    record = _read_checksum_record(path)
+    try:
+        if record.get("sha256") == expected and record.get("size") != path.stat().st_size:
+            return False
+    except OSError:
+        pass
+    return _cached_sha256_file(path, record).lower() == expected
+
+
+def _sha256_files_parallel(paths: list[Path]) -> dict[Path, str]:
+    """
+    Hashes several files at once through _cached_sha256_file, so the digests
+    land in the checksum cache too. hashlib drops the GIL while it hashes,
+    so threads spread the work across cores without process start-up costs.
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1, len(paths))) as pool:
+        return dict(zip(paths, pool.map(_cached_sha256_file, paths)))
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copies src to dst with its metadata, like shutil.copy2. Where available
+    (Linux) the data is copied in-kernel with os.copy_file_range rather than
+    through user-space buffers, and can become a reflink on btrfs/XFS.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        # a short copy (some FUSE / network filesystems): redo it with copy2
+                        break
+                    remaining -= n
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            # e.g. EXDEV on older kernels or a filesystem that doesn't support it
+            pass
+    shutil.copy2(src, dst)
+
+
+def _install_copy(src: Path, dst: Path) -> None:
+    """
+    Puts an executable copy of src at dst. The copy is made next to dst and
+    renamed over it, so dst is never missing or half-written; os.replace
+    overwrites in one step, dst doesn't need unlinking first.
+
+    On the same filesystem the "copy" is a hard link: no bytes are copied and
+    src (the versioned cache entry) stays in place. Nothing here ever writes
+    to either name in place, so sharing the inode is safe.
+    """
+    tmp = dst.with_name(dst.name + ".tmp")
+    linked = False
+    try:
+        try:
+            tmp.unlink(missing_ok=True)
+            os.link(src, tmp)
+            linked = True
+        except OSError:
+            # EXDEV across filesystems, or no hard link support (FAT, some mounts)
+            _copy_file(src, tmp)
+        _make_executable(tmp)
+        tmp.replace(dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _store_install_record(src, dst, linked=linked)
+
+
+def _install_record_file(dst: Path) -> Path:
+    key = hashlib.sha256(str(dst.absolute()).encode("utf-8")).hexdigest()
+    return install_record_dir() / f"{key}.json"
+
+
+def _stat_stamp(st: os.stat_result) -> list[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def _store_install_record(src: Path, dst: Path, *, linked: bool) -> None:
+    record_file = _install_record_file(dst)
+    try:
+        if linked:
+            # a hard link is recognised by its inode; drop any record of an older copy
+            record_file.unlink(missing_ok=True)
+            return
+        record = {"src": str(src.absolute()), "src_stat": _stat_stamp(src.stat()), "dst_stat": _stat_stamp(dst.stat())}
+    except OSError:
+        return
+    _write_json_atomic(record_file, record)
+
+
+def _is_installed_copy(src: Path, dst: Path) -> bool:
+    """
+    Whether dst is what _install_copy last put there from src: the same inode
+    for a hard link, else a copy recorded under install_record_dir() whose
+    source and destination are both unchanged since. Size and mtime alone
+    won't do: tar -x keeps each member's mtime, so another version's binary
+    can match on both.
+    """
+    try:
+        s, d = src.stat(), dst.stat()
+    except OSError:
+        return False
+    if os.name != "nt" and not d.st_mode & stat.S_IXUSR:
+        return False
+    if s.st_ino and (s.st_dev, s.st_ino) == (d.st_dev, d.st_ino):
+        return True
+    try:
+        record = json.loads(_install_record_file(dst).read_bytes())
+    except (OSError, ValueError):
+        return False
+    return record == {"src": str(src.absolute()), "src_stat": _stat_stamp(s), "dst_stat": _stat_stamp(d)}
+
+
 def _make_executable(path: Path) -> None:
     if os.name == "nt":
         return
@@ -127,8 +757,17 @@ def _make_executable(path: Path) -> None:
 
 
 def latest_version(repo: str = DEFAULT_REPO) -> str:
-    data = _http_get_bytes(GITHUB_API_LATEST(repo), headers={"User-Agent": "neo4j-mcp-installer"})
-    obj = json.loads(data.decode("utf-8"))
+    data = _http_get_cached(
+        GITHUB_API_LATEST(repo),
+        http_cache_dir() / "latest.json",
+        headers={"User-Agent": "neo4j-mcp-installer"},
+    )
+    # the release JSON is mostly notes and asset metadata; pull tag_name out
+    # directly and only fall back to a full parse if that misses
+    m = _TAG_NAME_RE.search(data)
+    if m:
+        return m.group(1).decode("utf-8")
+    obj = json.loads(data)
     tag = obj.get("tag_name")
     if not tag:
         raise RuntimeError("Could not determine latest release tag_name from GitHub API.")
@@ -144,7 +783,11 @@ def _download_checksums_text(version: str, base_url: str) -> Optional[str]:
     ver = _normalize_version_for_checksums(version)
     url = f"{base_url}/{version}/neo4j-mcp_{ver}_checksums.txt"
     try:
-        b = _http_get_bytes(url, headers={"User-Agent": "neo4j-mcp-installer"})
+        b = _http_get_cached(
+            url,
+            http_cache_dir() / f"checksums-{version}.json",
+            headers={"User-Agent": "neo4j-mcp-installer"},
+        )
         return b.decode("utf-8", errors="replace")
     except urllib.error.HTTPError as e:
         if e.code in (404, 403):
@@ -154,73 +797,339 @@ def _download_checksums_text(version: str, base_url: str) -> Optional[str]:
         return None
 
 
-def _expected_sha_from_checksums(checksums_text: str, filename: str) -> Optional[str]:
+@functools.lru_cache(maxsize=8)
+def _parse_checksums(checksums_text: str) -> dict[str, str]:
     """
-    Parses the block format you showed:
+    Parses checksums.txt into {filename: sha256} with a single _CHECKSUM_RE
+    pass. Understands the block format the releases use:
 
       neo4j-mcp_Darwin_arm64.tar.gz
       sha256:<hash>
+
+    and tolerates "<sha> <filename>" lines in case that ever changes. Block
+    entries win if a file appears in both forms.
     """
-    lines = [ln.strip() for ln in checksums_text.splitlines() if ln.strip()]
-    for i in range(len(lines) - 1):
-        if lines[i] == filename and lines[i + 1].startswith("sha256:"):
-            return lines[i + 1].split("sha256:", 1)[1].strip().lower()
+    block: dict[str, str] = {}
+    plain: dict[str, str] = {}
+    # findall hands back plain tuples, skipping a match object per entry
+    for sha, name, block_name, block_sha in _CHECKSUM_RE.findall(checksums_text):
+        if sha:
+            plain.setdefault(name, sha.lower())
+        else:
+            block.setdefault(block_name, block_sha.lower())
+    return {**plain, **block}
+
 
-    # tolerate "<sha> <filename>" if it ever changes
-    for ln in lines:
-        parts = ln.split()
-        if len(parts) >= 2 and parts[-1] == filename and re.fullmatch(r"[0-9a-fA-F]{64}", parts[0]):
-            return parts[0].lower()
+def _expected_sha_from_checksums(checksums_text: str, filename: str) -> Optional[str]:
+    return _parse_checksums(checksums_text).get(filename)
 
-    return None
 
+def _open_tmpfile(directory: Path) -> Optional[int]:
+    # anonymous O_TMPFILE inode in directory, or None where that isn't available
+    if not hasattr(os, "O_TMPFILE") or not os.path.isdir("/proc/self/fd"):
+        return None
+    try:
+        return os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o755)
+    except OSError as e:
+        # filesystem or kernel without O_TMPFILE support
+        if e.errno in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+            return None
+        raise
 
-def _extract_archive(archive: Path, out_bin: Path, target: Target) -> None:
-    out_bin.parent.mkdir(parents=True, exist_ok=True)
-    wanted = target.extracted_binary_name
 
-    if target.archive_ext == ".tar.gz":
-        with tarfile.open(archive, "r:gz") as tf:
-            members = [m for m in tf.getmembers() if m.isfile()]
-            candidate = next((m for m in members if Path(m.name).name == wanted), None)
-            if candidate is None:
-                candidate = next((m for m in members if Path(m.name).name in ("neo4j-mcp", "neo4j-mcp.exe")), None)
-            if candidate is None:
-                raise RuntimeError(f"Could not find neo4j-mcp binary inside {archive.name}")
+@contextlib.contextmanager
+def _atomic_output(out_bin: Path):
+    """
+    Yields a binary file object that only appears as out_bin once it has been
+    fully written.
+
+    On Linux the bytes go into an anonymous O_TMPFILE inode that is linked into
+    place afterwards, so a partial file never has a name and needs no cleanup
+    if extraction fails. Elsewhere it falls back to <name>.tmp + rename.
+    """
+    tmp = out_bin.with_suffix(out_bin.suffix + ".tmp")
+    fd = _open_tmpfile(out_bin.parent)
+
+    if fd is not None:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            # passing a dir fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which
+            # links the inode behind /proc/self/fd/N rather than the magic symlink
+            proc_fd = os.open("/proc/self/fd", os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                try:
+                    os.link(str(fd), out_bin, src_dir_fd=proc_fd, follow_symlinks=True)
+                except FileExistsError:
+                    # replace the existing file atomically via a named temporary link
+                    tmp.unlink(missing_ok=True)
+                    os.link(str(fd), tmp, src_dir_fd=proc_fd, follow_symlinks=True)
+                    tmp.replace(out_bin)
+            finally:
+                os.close(proc_fd)
+        return
+
+    try:
+        with open(tmp, "wb") as f:
+            yield f
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if out_bin.exists():
+        out_bin.unlink()
+    tmp.replace(out_bin)
+
+
+@contextlib.contextmanager
+def _read_once(path: Path, buffering: int = -1):
+    """
+    Opens path for one sequential pass. The kernel is told to read ahead
+    aggressively and, afterwards, to drop the pages from the page cache since
+    they won't be read again. Hints are skipped where posix_fadvise is missing.
+    """
+    fadvise = getattr(os, "posix_fadvise", None)
+    with open(path, "rb", buffering=buffering) as f:
+        if fadvise is not None:
+            with contextlib.suppress(OSError):
+                fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            yield f
+        finally:
+            if fadvise is not None:
+                with contextlib.suppress(OSError):
+                    fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+_BINARY_NAMES = ("neo4j-mcp", "neo4j-mcp.exe")
+# tar members are copied in bigger steps than _CHUNK_SIZE: each read goes
+# through tarfile's Python-level gzip layer, so fewer calls pay off
+_TAR_COPY_SIZE = 2 * 1024 * 1024
+
+
+def _igzip():
+    """
+    Returns python-isal's igzip module if installed (pip install
+    "neo4j-mcp-installer[fast]"), else None. Its GzipFile decompresses
+    roughly twice as fast as the zlib-backed one.
+    """
+    try:
+        from isal import igzip
+    except ImportError:
+        return None
+    return igzip
+
+
+def _extract_from_tar(raw, out_bin: Path, wanted: str, source: str, *, stream: bool = False) -> None:
+    import tarfile
+
+    with contextlib.ExitStack() as stack:
+        # stream ("r|") mode is only for non-seekable sources such as an HTTP
+        # response; on a file "r:" decompresses faster. Either way members are
+        # read lazily and the scan stops at the binary. As for zip, a member
+        # named `wanted` beats the other binary name; since a stream can't be
+        # rewound, that one is written out when seen and replaced if need be.
+        igzip = _igzip()
+        if igzip is not None:
+            gz = stack.enter_context(igzip.IGzipFile(fileobj=raw, mode="rb"))
+            tf = stack.enter_context(tarfile.open(fileobj=gz, mode="r|" if stream else "r:"))
+        else:
+            tf = stack.enter_context(tarfile.open(fileobj=raw, mode="r|gz" if stream else "r:gz"))
+
+        extracted = False
+        for candidate in tf:
+            name = Path(candidate.name).name
+            if not candidate.isfile() or name not in _BINARY_NAMES or (extracted and name != wanted):
+                continue
 
             fobj = tf.extractfile(candidate)
             if fobj is None:
-                raise RuntimeError(f"Failed to extract {candidate.name} from {archive.name}")
+                raise RuntimeError(f"Failed to extract {candidate.name} from {source}")
+
+            with _atomic_output(out_bin) as f:
+                shutil.copyfileobj(fobj, f, _TAR_COPY_SIZE)
+            extracted = True
+            if name == wanted:
+                return
 
-            tmp = out_bin.with_suffix(out_bin.suffix + ".tmp")
-            with open(tmp, "wb") as f:
-                f.write(fobj.read())
-            if out_bin.exists():
-                out_bin.unlink()
-            tmp.replace(out_bin)
+        if not extracted:
+            raise RuntimeError(f"Could not find neo4j-mcp binary inside {source}")
 
+
+def _extract_from_zip(raw, out_bin: Path, wanted: str, source: str) -> None:
+    import zipfile
+
+    with zipfile.ZipFile(raw, "r") as zf:
+        names = zf.namelist()
+        match = next((n for n in names if Path(n).name == wanted), None)
+        if match is None:
+            match = next((n for n in names if Path(n).name in _BINARY_NAMES), None)
+        if match is None:
+            raise RuntimeError(f"Could not find neo4j-mcp binary inside {source}")
+
+        # read1 hands back whatever the inflater has ready instead of
+        # filling a full buffer first
+        with zf.open(match, "r") as src, _atomic_output(out_bin) as f:
+            while True:
+                chunk = src.read1(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+
+
+def _find_extracted_binary(root: Path, wanted: str) -> Optional[Path]:
+    found = [p for p in root.rglob("*") if p.name in _BINARY_NAMES and p.is_file() and not p.is_symlink()]
+    return next((p for p in found if p.name == wanted), found[0] if found else None)
+
+
+def _extract_with_system_tool(archive: Path, out_bin: Path, target: Target) -> bool:
+    """
+    Extracts with the system tar / unzip, which decompress faster than the
+    pure-Python modules. Returns False if the tool is missing, fails, or the
+    archive holds no binary, so the caller can fall back to tarfile / zipfile
+    (which also reports the error properly). NEO4J_MCP_PURE_PYTHON=1 opts out.
+    """
+    if os.environ.get("NEO4J_MCP_PURE_PYTHON"):
+        return False
+    if target.archive_ext == ".tar.gz":
+        tool = shutil.which("tar")
     elif target.archive_ext == ".zip":
-        with zipfile.ZipFile(archive, "r") as zf:
-            names = zf.namelist()
-            match = next((n for n in names if Path(n).name == wanted), None)
-            if match is None:
-                match = next((n for n in names if Path(n).name in ("neo4j-mcp.exe", "neo4j-mcp")), None)
-            if match is None:
-                raise RuntimeError(f"Could not find neo4j-mcp binary inside {archive.name}")
-
-            tmp = out_bin.with_suffix(out_bin.suffix + ".tmp")
-            with open(tmp, "wb") as f:
-                f.write(zf.read(match))
-            if out_bin.exists():
-                out_bin.unlink()
-            tmp.replace(out_bin)
+        tool = shutil.which("unzip")
+    else:
+        return False
+    if tool is None:
+        return False
+
+    import subprocess
+    import tempfile
+
+    # extract next to out_bin so the final move is a same-filesystem rename
+    tmp_dir = Path(tempfile.mkdtemp(prefix=".extract-", dir=out_bin.parent))
+    try:
+        if target.archive_ext == ".tar.gz":
+            cmd = [tool, "-xzf", str(archive), "-C", str(tmp_dir)]
+        else:
+            cmd = [tool, "-q", "-o", str(archive), "-d", str(tmp_dir)]
+        try:
+            subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            return False
+
+        found = _find_extracted_binary(tmp_dir, target.extracted_binary_name)
+        if found is None:
+            return False
+        os.replace(found, out_bin)
+        return True
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _extract_with_python(archive: Path, out_bin: Path, target: Target) -> None:
+    if target.archive_ext == ".tar.gz":
+        with _read_once(archive, buffering=_TAR_COPY_SIZE) as raw:
+            _extract_from_tar(raw, out_bin, target.extracted_binary_name, archive.name)
+    elif target.archive_ext == ".zip":
+        with _read_once(archive) as raw:
+            _extract_from_zip(raw, out_bin, target.extracted_binary_name, archive.name)
+    else:
+        raise RuntimeError(f"Unsupported archive type: {target.archive_ext}")
+
+
+def _extract_archive(archive: Path, out_bin: Path, target: Target) -> None:
+    # out_bin.parent must already exist (install_binary creates it up front)
+    if not _extract_with_system_tool(archive, out_bin, target):
+        _extract_with_python(archive, out_bin, target)
+    _make_executable(out_bin)
+
 
+def _download_and_extract(url: str, out_bin: Path, target: Target, headers: Optional[dict[str, str]] = None) -> None:
+    """
+    Extracts the binary straight from the HTTP response, without writing the
+    archive to disk. Only for unverified installs: there is no file to check
+    against checksums.txt afterwards.
+    """
+    # out_bin.parent must already exist (install_binary creates it up front)
+    source = url.rsplit("/", 1)[-1]
+    if target.archive_ext == ".tar.gz":
+        with _urlopen(url, dict(headers or {})) as resp:
+            _extract_from_tar(resp, out_bin, target.extracted_binary_name, source, stream=True)
+    elif target.archive_ext == ".zip":
+        import tempfile
+
+        # the zip directory sits at the end of the file, so it needs a seekable
+        # copy; kept in memory unless the release grows unexpectedly large
+        if sys.version_info >= (3, 11):
+            spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+        else:
+            # SpooledTemporaryFile has no seekable() before 3.11, which zipfile needs
+            spool = tempfile.TemporaryFile()
+        with spool:
+            with _urlopen(url, dict(headers or {})) as resp:
+                _copy_response(resp, spool)
+            spool.seek(0)
+            _extract_from_zip(spool, out_bin, target.extracted_binary_name, source)
     else:
         raise RuntimeError(f"Unsupported archive type: {target.archive_ext}")
 
     _make_executable(out_bin)
 
 
+def _fetch_archive(
+    url: str, archive: Path, *, asset: str, version: str, base_url: str, verify: bool, force: bool = False
+) -> None:
+    """
+    Makes sure archive holds a (verified, if requested) copy of url.
+
+    When verifying, an archive left behind by an earlier run is reused if it
+    still matches checksums.txt, which skips the download entirely on
+    reinstall / upgrade-to-same-version / broken-extract. With force the
+    archive is re-read for that check rather than trusting the digest cache.
+    """
+    checksums: Optional[str] = None
+    have_checksums = False
+    if verify and archive.exists():
+        checksums = _download_checksums_text(version=version, base_url=base_url)
+        have_checksums = True
+        expected = _expected_sha_from_checksums(checksums, asset) if checksums else None
+        if expected and _matches_sha256(archive, expected, use_cache=not force):
+            return
+
+    tmp_archive = archive.with_suffix(archive.suffix + ".tmp")
+    if tmp_archive.exists():
+        tmp_archive.unlink(missing_ok=True)
+
+    hasher = hashlib.sha256() if verify else None
+
+    if hasher is None or have_checksums:
+        _http_download(url, tmp_archive, headers={"User-Agent": "neo4j-mcp-installer"}, hasher=hasher)
+    else:
+        # fetch the small checksums file while the archive is streaming in
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            checksums_future = pool.submit(_download_checksums_text, version=version, base_url=base_url)
+            _http_download(url, tmp_archive, headers={"User-Agent": "neo4j-mcp-installer"}, hasher=hasher)
+            checksums = checksums_future.result()
+
+    if hasher is not None and checksums:
+        expected = _expected_sha_from_checksums(checksums, asset)
+        if expected:
+            actual = hasher.hexdigest()
+            if actual.lower() != expected.lower():
+                tmp_archive.unlink(missing_ok=True)
+                raise RuntimeError(
+                    "Checksum verification failed.\n"
+                    f"Expected: {expected}\n"
+                    f"Actual:   {actual}\n"
+                    f"Asset:    {asset}\n"
+                    f"URL:      {url}"
+                )
+
+    if archive.exists():
+        archive.unlink()
+    tmp_archive.replace(archive)
+    if hasher is not None:
+        # the digest is already known; a later reuse check needn't rehash
+        _store_cached_sha256(archive, hasher.hexdigest())
+
+
 def install_binary(
     *,
     version: Optional[str] = None,
@@ -254,47 +1163,69 @@ def install_binary(
     if not extracted.exists() or force_download:
         asset = target.asset_name
         url = f"{base_url}/{version}/{asset}"
-
         archive = archive_path(version, target)
-        tmp_archive = archive.with_suffix(archive.suffix + ".tmp")
-        if tmp_archive.exists():
-            tmp_archive.unlink(missing_ok=True)
-
-        _http_download(url, tmp_archive, headers={"User-Agent": "neo4j-mcp-installer"})
-
-        if verify and not os.environ.get("NEO4J_MCP_SKIP_VERIFY"):
-            checksums = _download_checksums_text(version=version, base_url=base_url)
-            if checksums:
-                expected = _expected_sha_from_checksums(checksums, asset)
-                if expected:
-                    actual = _sha256_file(tmp_archive)
-                    if actual.lower() != expected.lower():
-                        tmp_archive.unlink(missing_ok=True)
-                        raise RuntimeError(
-                            "Checksum verification failed.\n"
-                            f"Expected: {expected}\n"
-                            f"Actual:   {actual}\n"
-                            f"Asset:    {asset}\n"
-                            f"URL:      {url}"
-                        )
-
-        archive.parent.mkdir(parents=True, exist_ok=True)
-        if archive.exists():
-            archive.unlink()
-        tmp_archive.replace(archive)
-
-        _extract_archive(archive=archive, out_bin=extracted, target=target)
+        verify = verify and not os.environ.get("NEO4J_MCP_SKIP_VERIFY")
+        # archive and extracted binary both live here; the helpers below
+        # rely on it existing rather than each creating it
+        version_dir(version).mkdir(parents=True, exist_ok=True)
+
+        if verify:
+            _fetch_archive(
+                url, archive, asset=asset, version=version, base_url=base_url, verify=verify, force=force_download
+            )
+            _extract_archive(archive=archive, out_bin=extracted, target=target)
+        else:
+            # nothing to check the archive against, so don't keep one around
+            _download_and_extract(url, extracted, target, headers={"User-Agent": "neo4j-mcp-installer"})
 
     # Install final binary into install_dir (copy, atomic replace)
-    final_name = target.extracted_binary_name
-    final_path = install_dir / final_name
-    tmp_final = install_dir / (final_name + ".tmp")
+    final_path = install_dir / target.extracted_binary_name
 
-    shutil.copy2(extracted, tmp_final)
-    _make_executable(tmp_final)
+    # re-running for the version that's already installed has nothing to do
+    if not force_download and _is_installed_copy(extracted, final_path):
+        return final_path, version, extracted
 
-    if final_path.exists():
-        final_path.unlink()
-    tmp_final.replace(final_path)
+    _install_copy(extracted, final_path)
 
     return final_path, version, extracted
+
+
+def install_binaries(
+    versions: list[str],
+    *,
+    repo: str = DEFAULT_REPO,
+    base_url: str = DEFAULT_BASE_URL,
+    verify: bool = True,
+    force_download: bool = False,
+    install_dir: Optional[Path] = None,
+) -> list[tuple[Path, str, Path]]:
+    """
+    Runs install_binary for each version in turn, e.g. to warm the cache for a
+    CI matrix. Archives already cached for those versions are re-verified up
+    front in parallel, so each install's reuse check is a checksum cache hit.
+    The binary in install_dir is left at the last version given.
+
+    Returns:
+      one install_binary result per version, in order
+    """
+    if verify and not os.environ.get("NEO4J_MCP_SKIP_VERIFY"):
+        target = detect_target()
+        _sha256_files_parallel(
+            [
+                archive_path(v, target)
+                for v in versions
+                if archive_path(v, target).exists() and (force_download or not extracted_path(v, target).exists())
+            ]
+        )
+
+    return [
+        install_binary(
+            version=v,
+            repo=repo,
+            base_url=base_url,
+            verify=verify,
+            force_download=force_download,
+            install_dir=install_dir,
+        )
+        for v in versions
+    ]
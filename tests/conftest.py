@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import copy
+import itertools
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from neo4j_mcp_installer import cli
+from neo4j_mcp_installer.cli import _get_parser
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cli_parser():
+    """Build the CLI parser once up front; main() reuses the cached instance."""
+    return _get_parser()
+
+
+@pytest.fixture(scope="session")
+def new_scratch_dir(tmp_path_factory):
+    """Makes empty directories under one session-wide root; tmp_path is one of them."""
+    root = tmp_path_factory.mktemp("scratch")
+    ids = itertools.count()
+
+    def make() -> Path:
+        path = root / f"t{next(ids)}"
+        path.mkdir()
+        return path
+
+    return make
+
+
+@pytest.fixture
+def tmp_path(new_scratch_dir):
+    """
+    A fresh empty directory per test, like pytest's own tmp_path but without
+    its per-test numbered-directory bookkeeping; the tests only ever need a
+    scratch area for a few small files.
+    """
+    return new_scratch_dir()
+
+
+@pytest.fixture
+def install_result(tmp_path):
+    """The (final_path, version, extracted) triple install_binary reports for tmp_path."""
+    return (tmp_path / "neo4j-mcp", "v1.0.0", tmp_path / "extracted")
+
+
+@pytest.fixture(scope="session")
+def install_template():
+    """One preconfigured install_binary mock; cli_mocks hands out copies of it."""
+    return Mock(spec=cli.install_binary, return_value=(Path("neo4j-mcp"), "v1.0.0", Path("extracted")))
+
+
+@pytest.fixture
+def cli_mocks(request, monkeypatch, tmp_path, install_template):
+    """
+    Replace the installer entry points the CLI calls; defaults install into tmp_path.
+    _on_path is only reached after an install, so it is patched just for tests marked
+    needs_on_path; elsewhere mocks.on_path is None.
+    """
+    install = copy.copy(install_template)
+    # a shallow copy shares the template's call lists; reset_mock rebinds fresh ones
+    install.reset_mock()
+    needs_on_path = request.node.get_closest_marker("needs_on_path") is not None
+    mocks = SimpleNamespace(
+        install=install,
+        default_dir=Mock(spec=cli.default_install_dir, return_value=tmp_path),
+        on_path=Mock(spec=cli._on_path, return_value=True) if needs_on_path else None,
+        data_root=Mock(spec=cli.data_root, return_value=tmp_path / "cache"),
+    )
+    monkeypatch.setattr(cli, "install_binary", mocks.install)
+    monkeypatch.setattr(cli, "default_install_dir", mocks.default_dir)
+    if mocks.on_path is not None:
+        monkeypatch.setattr(cli, "_on_path", mocks.on_path)
+    monkeypatch.setattr(cli, "data_root", mocks.data_root)
+    return mocks
@@ -1,71 +1,85 @@
 """Tests for the CLI module."""
 from __future__ import annotations
 
-import argparse
 import os
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from neo4j_mcp_installer import cli
 from neo4j_mcp_installer.cli import _on_path, _print_path_help, main
 
 
-class TestOnPath:
-    """Tests for the _on_path helper function."""
+def assert_in_stdout(capsys, *needles: str) -> None:
+    """Read captured stdout once and check that every needle appears in it."""
+    out = capsys.readouterr().out
+    for needle in needles:
+        assert needle in out
 
-    def test_on_path_returns_true_when_dir_in_path(self, tmp_path):
-        """Test that _on_path returns True when directory is in PATH."""
-        test_dir = tmp_path / "bin"
-        test_dir.mkdir()
-        
-        with patch.dict(os.environ, {"PATH": str(test_dir)}):
-            assert _on_path(test_dir) is True
 
-    def test_on_path_returns_false_when_dir_not_in_path(self, tmp_path):
-        """Test that _on_path returns False when directory is not in PATH."""
-        test_dir = tmp_path / "bin"
-        test_dir.mkdir()
-        other_dir = tmp_path / "other"
-        
-        with patch.dict(os.environ, {"PATH": str(other_dir)}):
-            assert _on_path(test_dir) is False
+@pytest.fixture(scope="session")
+def path_dirs(tmp_path_factory):
+    """A shared root holding existing bin/ and other/ directories."""
+    root = tmp_path_factory.mktemp("on_path")
+    (root / "bin").mkdir()
+    (root / "other").mkdir()
+    return root
 
-    def test_on_path_handles_empty_path(self, tmp_path):
-        """Test that _on_path handles empty PATH."""
-        test_dir = tmp_path / "bin"
-        test_dir.mkdir()
-        
-        with patch.dict(os.environ, {"PATH": ""}):
-            assert _on_path(test_dir) is False
 
-    def test_on_path_handles_multiple_paths(self, tmp_path):
-        """Test that _on_path handles multiple directories in PATH."""
+class TestOnPath:
+    """Tests for the _on_path helper function."""
+
+    @pytest.mark.parametrize(
+        "path_value_fn, expected",
+        [
+            (lambda d: str(d / "bin"), True),
+            (lambda d: str(d / "other"), False),
+            (lambda d: "", False),
+            (lambda d: os.pathsep.join([str(d / "other"), str(d / "bin")]), True),
+            (lambda d: str(d) + os.sep + "." + os.sep + "bin" + os.sep, True),
+        ],
+        ids=["dir_in_path", "dir_not_in_path", "empty_path", "multiple_paths", "unnormalized_entry"],
+    )
+    def test_on_path(self, monkeypatch, path_dirs, path_value_fn, expected):
+        """Test _on_path against PATH values built from the shared directories."""
+        monkeypatch.setenv("PATH", path_value_fn(path_dirs))
+        assert _on_path(path_dirs / "bin") is expected
+
+    def test_on_path_follows_path_changes(self, monkeypatch, path_dirs):
+        """Test that a changed PATH is not answered from a stale split."""
+        test_dir = path_dirs / "bin"
+        
+        monkeypatch.setenv("PATH", str(test_dir))
+        assert _on_path(test_dir) is True
+        monkeypatch.setenv("PATH", str(path_dirs / "other"))
+        assert _on_path(test_dir) is False
+
+    def test_on_path_matches_symlinked_entry(self, monkeypatch, tmp_path):
+        """Test that _on_path matches a PATH entry that is a symlink to the directory."""
         test_dir = tmp_path / "bin"
         test_dir.mkdir()
-        other_dir = tmp_path / "other"
-        other_dir.mkdir()
+        link = tmp_path / "link"
+        try:
+            link.symlink_to(test_dir, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
         
-        path_value = os.pathsep.join([str(other_dir), str(test_dir)])
-        with patch.dict(os.environ, {"PATH": path_value}):
-            assert _on_path(test_dir) is True
-
-    def test_on_path_handles_resolve_exception(self):
-        """Test that _on_path handles exceptions from resolve()."""
-        # Create a mock Path that raises an exception on resolve()
-        mock_path = MagicMock(spec=Path)
-        mock_path.resolve.side_effect = OSError("Cannot resolve path")
-        mock_path.__str__ = MagicMock(return_value="/test/path")
+        monkeypatch.setenv("PATH", str(link))
+        assert _on_path(test_dir) is True
+
+    def test_on_path_handles_stat_error(self, monkeypatch, path_dirs):
+        """Test a directory that can't be stat'ed is matched by string only."""
+        missing = path_dirs / "missing"
         
-        # Set up PATH with the same string representation
-        with patch.dict(os.environ, {"PATH": "/test/path"}):
-            # Should fall back to string comparison and return True
-            assert _on_path(mock_path) is True
+        monkeypatch.setenv("PATH", str(missing))
+        assert _on_path(missing) is True
         
-        # Test when not in PATH
-        with patch.dict(os.environ, {"PATH": "/other/path"}):
-            assert _on_path(mock_path) is False
+        # no string match, and os.stat raises OSError: not on PATH
+        monkeypatch.setenv("PATH", str(path_dirs / "bin"))
+        assert _on_path(missing) is False
 
 
 class TestPrintPathHelp:
@@ -73,16 +87,14 @@ class TestPrintPathHelp:
 
     def test_print_path_help_windows(self, tmp_path, capsys):
         """Test Windows-specific PATH help."""
-        with patch("neo4j_mcp_installer.cli.os.name", "nt"):
+        with patch.object(cli.os, "name", "nt"):
             _print_path_help(tmp_path)
             
-        captured = capsys.readouterr()
-        assert "Windows" in captured.out
-        assert str(tmp_path) in captured.out
+        assert_in_stdout(capsys, "Windows", str(tmp_path))
 
     def test_print_path_help_unix(self, tmp_path, capsys):
         """Test Unix-specific PATH help."""
-        with patch("neo4j_mcp_installer.cli.os.name", "posix"):
+        with patch.object(cli.os, "name", "posix"):
             _print_path_help(tmp_path)
             
         captured = capsys.readouterr()
@@ -90,401 +102,249 @@ class TestPrintPathHelp:
         assert ".local/bin" in captured.out
 
 
+@pytest.mark.needs_on_path
 class TestMainInstall:
     """Tests for the install command."""
 
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_basic(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test basic install command."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v1.0.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "install"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=True,
-            force_download=False,
-            install_dir=tmp_path,
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            ([], {}),
+            (["--version", "v1.2.0"], {"version": "v1.2.0"}),
+            (["--install-dir", "custom"], {"install_dir": Path("custom")}),
+            (["--no-verify"], {"verify": False}),
+            (["--force"], {"force_download": True}),
+            (
+                ["--version", "v1.5.0", "--install-dir", "custom", "--no-verify", "--force"],
+                {"version": "v1.5.0", "install_dir": Path("custom"), "verify": False, "force_download": True},
+            ),
+        ],
+        ids=["basic", "with_version", "with_custom_dir", "no_verify", "force", "all_flags"],
+    )
+    def test_install(self, cli_mocks, monkeypatch, tmp_path, args, expected):
+        """Test install passes its flags through to install_binary."""
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "install", *args])
+        main()
+        
+        cli_mocks.install.assert_called_once_with(
+            **{"version": None, "verify": True, "force_download": False, "install_dir": tmp_path, **expected}
         )
 
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_with_version(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test install with specific version."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v1.2.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "install", "--version", "v1.2.0"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version="v1.2.0",
-            verify=True,
-            force_download=False,
-            install_dir=tmp_path,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_with_custom_dir(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test install with custom install directory."""
-        custom_dir = tmp_path / "custom"
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (custom_dir / "neo4j-mcp", "v1.0.0", custom_dir / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "install", "--install-dir", str(custom_dir)]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=True,
-            force_download=False,
-            install_dir=custom_dir,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_no_verify(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test install with --no-verify flag."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v1.0.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "install", "--no-verify"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=False,
-            force_download=False,
-            install_dir=tmp_path,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_force(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test install with --force flag."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v1.0.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "install", "--force"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=True,
-            force_download=True,
-            install_dir=tmp_path,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_all_flags(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test install with all flags combined."""
-        custom_dir = tmp_path / "custom"
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (custom_dir / "neo4j-mcp", "v1.5.0", custom_dir / "extracted")
-        
-        with patch.object(
-            sys,
-            "argv",
-            ["neo4j-mcp-installer", "install", "--version", "v1.5.0", "--install-dir", str(custom_dir), "--no-verify", "--force"],
-        ):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version="v1.5.0",
-            verify=False,
-            force_download=True,
-            install_dir=custom_dir,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_install_shows_path_help_when_not_on_path(self, mock_on_path, mock_default_dir, mock_install, tmp_path, capsys):
+    def test_install_shows_path_help_when_not_on_path(self, cli_mocks, install_result, monkeypatch, capsys):
         """Test that install shows PATH help when install dir is not on PATH."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = False
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v1.0.0", tmp_path / "extracted")
+        cli_mocks.on_path.return_value = False
+        cli_mocks.install.return_value = install_result
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "install"]):
-            main()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "install"])
+        main()
         
         captured = capsys.readouterr()
+        assert f"Installed: {install_result[0]}" in captured.out
         assert "PATH" in captured.out or "path" in captured.out.lower()
 
 
+@pytest.mark.needs_on_path
 class TestMainUpgrade:
     """Tests for the upgrade command."""
 
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_upgrade_basic(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test basic upgrade command."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v2.0.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "upgrade"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=True,
-            force_download=True,  # upgrade always forces
-            install_dir=tmp_path,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_upgrade_with_version(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test upgrade with specific version."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v2.1.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "upgrade", "--version", "v2.1.0"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version="v2.1.0",
-            verify=True,
-            force_download=True,
-            install_dir=tmp_path,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_upgrade_with_custom_dir(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test upgrade with custom install directory."""
-        custom_dir = tmp_path / "custom"
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (custom_dir / "neo4j-mcp", "v2.0.0", custom_dir / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "upgrade", "--install-dir", str(custom_dir)]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=True,
-            force_download=True,
-            install_dir=custom_dir,
-        )
-
-    @patch("neo4j_mcp_installer.cli.install_binary")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli._on_path")
-    def test_upgrade_no_verify(self, mock_on_path, mock_default_dir, mock_install, tmp_path):
-        """Test upgrade with --no-verify flag."""
-        mock_default_dir.return_value = tmp_path
-        mock_on_path.return_value = True
-        mock_install.return_value = (tmp_path / "neo4j-mcp", "v2.0.0", tmp_path / "extracted")
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "upgrade", "--no-verify"]):
-            main()
-        
-        mock_install.assert_called_once_with(
-            version=None,
-            verify=False,
-            force_download=True,
-            install_dir=tmp_path,
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            ([], {}),
+            (["--version", "v2.1.0"], {"version": "v2.1.0"}),
+            (["--install-dir", "custom"], {"install_dir": Path("custom")}),
+            (["--no-verify"], {"verify": False}),
+        ],
+        ids=["basic", "with_version", "with_custom_dir", "no_verify"],
+    )
+    def test_upgrade(self, cli_mocks, monkeypatch, tmp_path, args, expected):
+        """Test upgrade passes its flags through and always forces a download."""
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "upgrade", *args])
+        main()
+        
+        cli_mocks.install.assert_called_once_with(
+            **{"version": None, "verify": True, "force_download": True, "install_dir": tmp_path, **expected}
         )
 
 
 class TestMainWhere:
     """Tests for the where command."""
 
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_where_default_unix(self, mock_default_dir, tmp_path, capsys):
-        """Test where command on Unix."""
-        mock_default_dir.return_value = tmp_path
+    @pytest.mark.parametrize("os_name, suffix", [("posix", ""), ("nt", ".exe")], ids=["unix", "windows"])
+    def test_where_default(self, cli_mocks, monkeypatch, tmp_path, capsys, os_name, suffix):
+        """Test where command prints the platform's binary name."""
+        monkeypatch.setattr(cli.os, "name", os_name)
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "where"])
+        main()
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "where"]):
-            main()
+        captured = capsys.readouterr()
+        assert str(tmp_path / f"neo4j-mcp{suffix}") == captured.out.strip()
+
+    @patch.object(cli, "_get_parser")
+    @patch.object(cli.os, "name", "posix")
+    def test_where_skips_argparse(self, mock_parser, cli_mocks, monkeypatch, tmp_path, capsys):
+        """Test bare where command answers without building the parser."""
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "where"])
+        main()
         
+        mock_parser.assert_not_called()
         captured = capsys.readouterr()
         assert str(tmp_path / "neo4j-mcp") == captured.out.strip()
 
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "nt")
-    def test_where_default_windows(self, mock_default_dir, tmp_path, capsys):
-        """Test where command on Windows."""
-        mock_default_dir.return_value = tmp_path
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "where"]):
+    @patch.object(cli.os, "name", "posix")
+    def test_where_with_flags_uses_parser(self, cli_mocks, monkeypatch, tmp_path, capsys):
+        """Test where command with extra arguments still goes through argparse."""
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "where", "--bogus"])
+        with pytest.raises(SystemExit):
             main()
         
-        captured = capsys.readouterr()
-        assert str(tmp_path / "neo4j-mcp.exe") == captured.out.strip()
+        cli_mocks.default_dir.assert_not_called()
+
+
+@pytest.fixture
+def fake_files(monkeypatch):
+    """
+    Stub Path.exists/unlink so uninstall tests need not create binaries on disk.
+    Paths added to .present exist until unlinked; anything else is checked for real.
+    """
+    real_exists = Path.exists
+    files = SimpleNamespace(present=set(), unlinked=[])
+
+    def unlink(self, missing_ok=False):
+        files.present.discard(self)
+        files.unlinked.append(self)
+
+    monkeypatch.setattr(Path, "exists", lambda self: self in files.present or real_exists(self))
+    monkeypatch.setattr(Path, "unlink", unlink)
+    return files
 
 
 class TestMainUninstall:
     """Tests for the uninstall command."""
 
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_uninstall_existing_binary(self, mock_default_dir, tmp_path, capsys):
+    @pytest.mark.parametrize(
+        "os_name, binary_name, subdir",
+        [
+            ("posix", "neo4j-mcp", None),
+            ("nt", "neo4j-mcp.exe", None),
+            ("posix", "neo4j-mcp", "custom"),
+        ],
+        ids=["unix", "windows", "custom_dir"],
+    )
+    def test_uninstall_existing_binary(
+        self, cli_mocks, fake_files, monkeypatch, tmp_path, capsys, os_name, binary_name, subdir
+    ):
         """Test uninstalling an existing binary."""
-        mock_default_dir.return_value = tmp_path
-        binary_path = tmp_path / "neo4j-mcp"
-        binary_path.touch()
-        
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "uninstall"]):
-            main()
-        
-        captured = capsys.readouterr()
-        assert not binary_path.exists()
-        assert "Removed:" in captured.out
-        assert str(binary_path) in captured.out
-
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_uninstall_nonexistent_binary(self, mock_default_dir, tmp_path, capsys):
+        args = []
+        install_dir = tmp_path
+        if subdir:
+            install_dir = tmp_path / subdir
+            args = ["--install-dir", str(install_dir)]
+        binary_path = install_dir / binary_name
+        fake_files.present.add(binary_path)
+        
+        monkeypatch.setattr(cli.os, "name", os_name)
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "uninstall", *args])
+        main()
+        
+        assert fake_files.unlinked == [binary_path]
+        assert_in_stdout(capsys, "Removed:", str(binary_path))
+
+    @patch.object(cli.os, "name", "posix")
+    def test_uninstall_nonexistent_binary(self, cli_mocks, fake_files, monkeypatch, tmp_path, capsys):
         """Test uninstalling when binary doesn't exist."""
-        mock_default_dir.return_value = tmp_path
         binary_path = tmp_path / "neo4j-mcp"
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "uninstall"]):
-            main()
-        
-        captured = capsys.readouterr()
-        assert "Not found:" in captured.out
-        assert str(binary_path) in captured.out
-
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "nt")
-    def test_uninstall_windows(self, mock_default_dir, tmp_path, capsys):
-        """Test uninstalling on Windows."""
-        mock_default_dir.return_value = tmp_path
-        binary_path = tmp_path / "neo4j-mcp.exe"
-        binary_path.touch()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "uninstall"])
+        main()
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "uninstall"]):
-            main()
-        
-        captured = capsys.readouterr()
-        assert not binary_path.exists()
-        assert "Removed:" in captured.out
+        assert fake_files.unlinked == []
+        assert_in_stdout(capsys, "Not found:", str(binary_path))
 
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_uninstall_with_custom_dir(self, mock_default_dir, tmp_path, capsys):
-        """Test uninstalling from custom directory."""
-        custom_dir = tmp_path / "custom"
-        custom_dir.mkdir()
-        mock_default_dir.return_value = tmp_path
-        binary_path = custom_dir / "neo4j-mcp"
-        binary_path.touch()
+    @patch.object(cli, "_get_parser")
+    @patch.object(cli.os, "name", "posix")
+    def test_uninstall_skips_argparse(self, mock_parser, cli_mocks, fake_files, monkeypatch, tmp_path, capsys):
+        """Test bare uninstall removes the binary without building the parser."""
+        binary_path = tmp_path / "neo4j-mcp"
+        fake_files.present.add(binary_path)
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "uninstall", "--install-dir", str(custom_dir)]):
-            main()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "uninstall"])
+        main()
         
-        captured = capsys.readouterr()
-        assert not binary_path.exists()
-        assert "Removed:" in captured.out
+        mock_parser.assert_not_called()
+        assert fake_files.unlinked == [binary_path]
 
-    @patch("neo4j_mcp_installer.cli.data_root")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_uninstall_with_clean_cache(self, mock_default_dir, mock_data_root, tmp_path, capsys):
+    @patch.object(cli.os, "name", "posix")
+    def test_uninstall_with_clean_cache(self, cli_mocks, fake_files, monkeypatch, tmp_path, capsys):
         """Test uninstalling with --clean-cache flag."""
-        mock_default_dir.return_value = tmp_path
         cache_dir = tmp_path / "cache"
-        cache_dir.mkdir()
-        (cache_dir / "test.txt").touch()
-        mock_data_root.return_value = cache_dir
+        fake_files.present.add(cache_dir)
+        cli_mocks.data_root.return_value = cache_dir
+        rmtree = MagicMock()
+        monkeypatch.setattr(cli.shutil, "rmtree", rmtree)
         
         binary_path = tmp_path / "neo4j-mcp"
-        binary_path.touch()
+        fake_files.present.add(binary_path)
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "uninstall", "--clean-cache"]):
-            main()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "uninstall", "--clean-cache"])
+        main()
         
-        captured = capsys.readouterr()
-        assert not binary_path.exists()
-        assert not cache_dir.exists()
-        assert "Removed cache:" in captured.out
-        assert str(cache_dir) in captured.out
-
-    @patch("neo4j_mcp_installer.cli.data_root")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_uninstall_clean_cache_when_cache_missing(self, mock_default_dir, mock_data_root, tmp_path, capsys):
+        assert fake_files.unlinked == [binary_path]
+        rmtree.assert_called_once_with(cache_dir)
+        assert_in_stdout(capsys, "Removed cache:", str(cache_dir))
+
+    @patch.object(cli.os, "name", "posix")
+    def test_uninstall_clean_cache_when_cache_missing(self, cli_mocks, fake_files, monkeypatch, tmp_path, capsys):
         """Test uninstalling with --clean-cache when cache doesn't exist."""
-        mock_default_dir.return_value = tmp_path
         cache_dir = tmp_path / "cache"
-        mock_data_root.return_value = cache_dir
+        cli_mocks.data_root.return_value = cache_dir
+        rmtree = MagicMock()
+        monkeypatch.setattr(cli.shutil, "rmtree", rmtree)
         
         binary_path = tmp_path / "neo4j-mcp"
-        binary_path.touch()
+        fake_files.present.add(binary_path)
         
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "uninstall", "--clean-cache"]):
-            main()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "uninstall", "--clean-cache"])
+        main()
         
-        captured = capsys.readouterr()
-        assert "Cache not found:" in captured.out
-        assert str(cache_dir) in captured.out
+        rmtree.assert_not_called()
+        assert_in_stdout(capsys, "Cache not found:", str(cache_dir))
 
-    @patch("neo4j_mcp_installer.cli.data_root")
-    @patch("neo4j_mcp_installer.cli.default_install_dir")
-    @patch("neo4j_mcp_installer.cli.os.name", "posix")
-    def test_uninstall_clean_cache_with_custom_dir(self, mock_default_dir, mock_data_root, tmp_path, capsys):
+    @patch.object(cli.os, "name", "posix")
+    def test_uninstall_clean_cache_with_custom_dir(self, cli_mocks, fake_files, monkeypatch, tmp_path, capsys):
         """Test uninstalling with both --install-dir and --clean-cache."""
         custom_dir = tmp_path / "custom"
-        custom_dir.mkdir()
-        mock_default_dir.return_value = tmp_path
         
         cache_dir = tmp_path / "cache"
-        cache_dir.mkdir()
-        (cache_dir / "test.txt").touch()
-        mock_data_root.return_value = cache_dir
+        fake_files.present.add(cache_dir)
+        cli_mocks.data_root.return_value = cache_dir
+        rmtree = MagicMock()
+        monkeypatch.setattr(cli.shutil, "rmtree", rmtree)
         
         binary_path = custom_dir / "neo4j-mcp"
-        binary_path.touch()
+        fake_files.present.add(binary_path)
         
-        with patch.object(
+        monkeypatch.setattr(
             sys, "argv", ["neo4j-mcp-installer", "uninstall", "--install-dir", str(custom_dir), "--clean-cache"]
-        ):
-            main()
+        )
+        main()
         
-        captured = capsys.readouterr()
-        assert not binary_path.exists()
-        assert not cache_dir.exists()
-        assert "Removed:" in captured.out
-        assert "Removed cache:" in captured.out
+        assert fake_files.unlinked == [binary_path]
+        rmtree.assert_called_once_with(cache_dir)
+        assert_in_stdout(capsys, "Removed:", "Removed cache:")
 
 
 class TestMainErrors:
     """Tests for error handling."""
 
-    def test_no_command_fails(self):
+    def test_no_command_fails(self, monkeypatch):
         """Test that running without a command fails."""
-        with patch.object(sys, "argv", ["neo4j-mcp-installer"]):
-            with pytest.raises(SystemExit):
-                main()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer"])
+        with pytest.raises(SystemExit):
+            main()
 
-    def test_invalid_command_fails(self):
+    def test_invalid_command_fails(self, monkeypatch):
         """Test that running with invalid command fails."""
-        with patch.object(sys, "argv", ["neo4j-mcp-installer", "invalid"]):
-            with pytest.raises(SystemExit):
-                main()
+        monkeypatch.setattr(sys, "argv", ["neo4j-mcp-installer", "invalid"])
+        with pytest.raises(SystemExit):
+            main()
@@ -1,40 +1,80 @@
 """Tests for the installer module."""
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import io
 import json
 import os
 import platform
+import shutil
+import subprocess
 import tarfile
 import zipfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, call, mock_open, patch
 
 import pytest
 
+from neo4j_mcp_installer import installer
 from neo4j_mcp_installer.installer import (
     DEFAULT_BASE_URL,
     DEFAULT_REPO,
     Target,
+    _atomic_output,
+    _can_keep_alive,
+    _cached_sha256_file,
+    _copy_file,
+    _crc32_file,
+    _download_and_extract,
     _download_checksums_text,
     _expected_sha_from_checksums,
     _extract_archive,
+    _fresh_until,
+    _hash_range,
     _http_download,
     _http_get_bytes,
+    _http_get_cached,
+    _install_copy,
     _make_executable,
     _normalize_version_for_checksums,
+    _parse_checksums,
+    _sha256_files_parallel,
     _sha256_file,
+    _sha256_mapped,
     archive_path,
+    checksum_cache_dir,
     data_root,
     default_install_dir,
     detect_target,
     extracted_path,
+    http_cache_dir,
+    install_binaries,
     install_binary,
     latest_version,
     version_dir,
     versions_dir,
 )
 
+# the target most tests install for; frozen, so one shared instance is safe
+_LINUX_X86_TARGET = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+
+
+@pytest.fixture(autouse=True)
+def clear_memoized_lookups():
+    """Platform and path lookups are memoized per process; start each test fresh."""
+    for fn in (detect_target, data_root, versions_dir, default_install_dir):
+        fn.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_root(new_scratch_dir, monkeypatch):
+    """Keep anything written under data_root() out of the real user data dir."""
+    root = new_scratch_dir()
+    monkeypatch.setattr(installer, "user_data_dir", lambda appname: str(root))
+    return root
+
 
 class TestTarget:
     """Tests for the Target dataclass."""
@@ -59,29 +99,38 @@ class TestTarget:
         target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
         assert target.extracted_binary_name == "neo4j-mcp.exe"
 
+    def test_target_names_cached(self):
+        """Test derived names are built once and don't affect equality or hashing."""
+        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+        
+        assert target.asset_name is target.asset_name
+        assert target == Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+        assert hash(target) == hash(Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz"))
+
 
 class TestDetectTarget:
     """Tests for the detect_target function."""
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_linux_x86_64(self, mock_machine, mock_system):
+    @pytest.fixture(autouse=True)
+    def uname(self, monkeypatch):
+        """Stand-ins for platform.system / platform.machine; set .return_value per test."""
+        mocks = SimpleNamespace(system=MagicMock(return_value="Linux"), machine=MagicMock(return_value="x86_64"))
+        monkeypatch.setattr(installer.platform, "system", mocks.system)
+        monkeypatch.setattr(installer.platform, "machine", mocks.machine)
+        return mocks
+
+    def test_detect_target_linux_x86_64(self, uname):
         """Test target detection for Linux x86_64."""
-        mock_system.return_value = "Linux"
-        mock_machine.return_value = "x86_64"
-        
         target = detect_target()
         
         assert target.os_name == "Linux"
         assert target.arch == "x86_64"
         assert target.archive_ext == ".tar.gz"
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_darwin_arm64(self, mock_machine, mock_system):
+    def test_detect_target_darwin_arm64(self, uname):
         """Test target detection for macOS ARM64."""
-        mock_system.return_value = "Darwin"
-        mock_machine.return_value = "arm64"
+        uname.system.return_value = "Darwin"
+        uname.machine.return_value = "arm64"
         
         target = detect_target()
         
@@ -89,23 +138,19 @@ class TestDetectTarget:
         assert target.arch == "arm64"
         assert target.archive_ext == ".tar.gz"
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_darwin_aarch64(self, mock_machine, mock_system):
+    def test_detect_target_darwin_aarch64(self, uname):
         """Test target detection for macOS with aarch64 machine type."""
-        mock_system.return_value = "Darwin"
-        mock_machine.return_value = "aarch64"
+        uname.system.return_value = "Darwin"
+        uname.machine.return_value = "aarch64"
         
         target = detect_target()
         
         assert target.arch == "arm64"
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_windows_amd64(self, mock_machine, mock_system):
+    def test_detect_target_windows_amd64(self, uname):
         """Test target detection for Windows AMD64."""
-        mock_system.return_value = "Windows"
-        mock_machine.return_value = "amd64"
+        uname.system.return_value = "Windows"
+        uname.machine.return_value = "amd64"
         
         target = detect_target()
         
@@ -113,44 +158,47 @@ class TestDetectTarget:
         assert target.arch == "x86_64"
         assert target.archive_ext == ".zip"
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_linux_i386(self, mock_machine, mock_system):
+    @pytest.mark.parametrize("machine,arch", [("AMD64", "x86_64"), ("ARM64", "arm64"), ("x86", "i386")])
+    def test_detect_target_windows_machine_names(self, uname, machine, arch):
+        """Test the upper-case machine names Windows reports are recognised."""
+        uname.system.return_value = "Windows"
+        uname.machine.return_value = machine
+        
+        assert detect_target() == Target(os_name="Windows", arch=arch, archive_ext=".zip")
+
+    def test_detect_target_linux_i386(self, uname):
         """Test target detection for Linux i386."""
-        mock_system.return_value = "Linux"
-        mock_machine.return_value = "i386"
+        uname.machine.return_value = "i386"
         
         target = detect_target()
         
         assert target.arch == "i386"
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_linux_i686(self, mock_machine, mock_system):
+    def test_detect_target_linux_i686(self, uname):
         """Test target detection for Linux i686."""
-        mock_system.return_value = "Linux"
-        mock_machine.return_value = "i686"
+        uname.machine.return_value = "i686"
         
         target = detect_target()
         
         assert target.arch == "i386"
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_unsupported_os(self, mock_machine, mock_system):
+    def test_detect_target_is_memoized(self, uname):
+        """Test repeated calls don't query the platform again."""
+        assert detect_target() is detect_target()
+        
+        uname.system.assert_called_once()
+        uname.machine.assert_called_once()
+
+    def test_detect_target_unsupported_os(self, uname):
         """Test that unsupported OS raises RuntimeError."""
-        mock_system.return_value = "FreeBSD"
-        mock_machine.return_value = "x86_64"
+        uname.system.return_value = "FreeBSD"
         
         with pytest.raises(RuntimeError, match="Unsupported OS"):
             detect_target()
 
-    @patch("neo4j_mcp_installer.installer.platform.system")
-    @patch("neo4j_mcp_installer.installer.platform.machine")
-    def test_detect_target_unsupported_arch(self, mock_machine, mock_system):
+    def test_detect_target_unsupported_arch(self, uname):
         """Test that unsupported architecture raises RuntimeError."""
-        mock_system.return_value = "Linux"
-        mock_machine.return_value = "sparc64"
+        uname.machine.return_value = "sparc64"
         
         with pytest.raises(RuntimeError, match="Unsupported architecture"):
             detect_target()
@@ -159,7 +207,7 @@ class TestDetectTarget:
 class TestPathHelpers:
     """Tests for path helper functions."""
 
-    @patch("neo4j_mcp_installer.installer.user_data_dir")
+    @patch.object(installer, "user_data_dir")
     def test_data_root(self, mock_user_data_dir, tmp_path):
         """Test data_root returns platformdirs path."""
         mock_user_data_dir.return_value = str(tmp_path / "data")
@@ -169,7 +217,7 @@ class TestPathHelpers:
         assert result == tmp_path / "data"
         mock_user_data_dir.assert_called_once_with("neo4j-mcp")
 
-    @patch("neo4j_mcp_installer.installer.data_root")
+    @patch.object(installer, "data_root")
     def test_versions_dir(self, mock_data_root, tmp_path):
         """Test versions_dir returns data_root/versions."""
         mock_data_root.return_value = tmp_path
@@ -178,7 +226,7 @@ class TestPathHelpers:
         
         assert result == tmp_path / "versions"
 
-    @patch("neo4j_mcp_installer.installer.versions_dir")
+    @patch.object(installer, "versions_dir")
     def test_version_dir(self, mock_versions_dir, tmp_path):
         """Test version_dir returns versions_dir/version."""
         mock_versions_dir.return_value = tmp_path
@@ -187,45 +235,52 @@ class TestPathHelpers:
         
         assert result == tmp_path / "v1.2.3"
 
-    @patch("neo4j_mcp_installer.installer.version_dir")
+    @patch.object(installer, "version_dir")
     def test_archive_path(self, mock_version_dir, tmp_path):
         """Test archive_path returns version_dir/asset_name."""
         mock_version_dir.return_value = tmp_path
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+        target = _LINUX_X86_TARGET
         
         result = archive_path("v1.2.3", target)
         
         assert result == tmp_path / "neo4j-mcp_Linux_x86_64.tar.gz"
 
-    @patch("neo4j_mcp_installer.installer.version_dir")
+    @patch.object(installer, "version_dir")
     def test_extracted_path(self, mock_version_dir, tmp_path):
         """Test extracted_path returns version_dir/binary_name."""
         mock_version_dir.return_value = tmp_path
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+        target = _LINUX_X86_TARGET
         
         result = extracted_path("v1.2.3", target)
         
         assert result == tmp_path / "neo4j-mcp"
 
-    @patch("neo4j_mcp_installer.installer.os.name", "posix")
+    @patch.object(installer.os, "name", "posix")
     def test_default_install_dir_unix(self):
         """Test default install dir on Unix."""
         result = default_install_dir()
         
         assert result == Path.home() / ".local" / "bin"
 
-    @patch("neo4j_mcp_installer.installer.os.name", "nt")
-    def test_default_install_dir_windows_no_localappdata(self):
+    @patch.object(installer.os, "name", "nt")
+    def test_default_install_dir_windows_no_localappdata(self, monkeypatch):
         """Test default install dir on Windows without LOCALAPPDATA."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(RuntimeError, match="LOCALAPPDATA is not set"):
-                default_install_dir()
+        monkeypatch.delenv("LOCALAPPDATA", raising=False)
+        
+        with pytest.raises(RuntimeError, match="LOCALAPPDATA is not set"):
+            default_install_dir()
 
 
 class TestHttpHelpers:
     """Tests for HTTP helper functions."""
 
-    @patch("neo4j_mcp_installer.installer.urllib.request.urlopen")
+    @pytest.fixture(autouse=True)
+    def no_pool(self, monkeypatch):
+        """Exercise the plain urllib path even when urllib3 is installed."""
+        monkeypatch.setattr(installer, "_pool", lambda: None)
+        monkeypatch.setattr(installer, "_can_keep_alive", lambda url: False)
+
+    @patch.object(installer.urllib.request, "urlopen")
     def test_http_get_bytes(self, mock_urlopen):
         """Test _http_get_bytes downloads and returns bytes."""
         mock_response = MagicMock()
@@ -238,7 +293,7 @@ class TestHttpHelpers:
         
         assert result == b"test data"
 
-    @patch("neo4j_mcp_installer.installer.urllib.request.urlopen")
+    @patch.object(installer.urllib.request, "urlopen")
     def test_http_get_bytes_with_headers(self, mock_urlopen):
         """Test _http_get_bytes with custom headers."""
         mock_response = MagicMock()
@@ -251,12 +306,13 @@ class TestHttpHelpers:
         
         assert result == b"test data"
 
-    @patch("neo4j_mcp_installer.installer.urllib.request.urlopen")
+    @patch.object(installer.urllib.request, "urlopen")
     def test_http_download(self, mock_urlopen, tmp_path):
         """Test _http_download downloads file to disk."""
         dest = tmp_path / "subdir" / "file.txt"
+        dest.parent.mkdir()
         mock_response = MagicMock()
-        mock_response.read.side_effect = [b"chunk1", b"chunk2", b""]
+        mock_response.readinto.side_effect = io.BytesIO(b"chunk1chunk2").readinto
         mock_response.__enter__ = MagicMock(return_value=mock_response)
         mock_response.__exit__ = MagicMock(return_value=None)
         mock_urlopen.return_value = mock_response
@@ -266,6 +322,486 @@ class TestHttpHelpers:
         assert dest.exists()
         assert dest.read_bytes() == b"chunk1chunk2"
 
+    @patch.object(installer.urllib.request, "urlopen")
+    def test_http_download_with_hasher(self, mock_urlopen, tmp_path):
+        """Test _http_download feeds every chunk to the hasher."""
+        dest = tmp_path / "file.txt"
+        mock_response = MagicMock()
+        mock_response.readinto.side_effect = io.BytesIO(b"chunk1chunk2").readinto
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_urlopen.return_value = mock_response
+        hasher = hashlib.sha256()
+        
+        _http_download("http://example.com/file", dest, hasher=hasher)
+        
+        assert hasher.hexdigest() == hashlib.sha256(b"chunk1chunk2").hexdigest()
+
+    @patch.object(installer.urllib.request, "urlopen")
+    def test_http_download_reads_large_chunks(self, mock_urlopen, tmp_path):
+        """Test _http_download reads the body in 1 MiB chunks."""
+        dest = tmp_path / "file.bin"
+        body = io.BytesIO(b"x" * (3 * 1024 * 1024))
+        sizes = []
+        
+        def readinto(buf):
+            sizes.append(len(buf))
+            return body.readinto(buf)
+        
+        mock_response = MagicMock()
+        mock_response.readinto.side_effect = readinto
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_urlopen.return_value = mock_response
+        
+        _http_download("http://example.com/file", dest)
+        
+        assert set(sizes) == {1024 * 1024}
+        assert len(sizes) == 4
+        assert dest.stat().st_size == 3 * 1024 * 1024
+
+
+class TestPooledHttp:
+    """Tests for HTTP helpers going through the shared connection pool."""
+
+    @staticmethod
+    def _pool_returning(monkeypatch, status=200, chunks=(b"",), reason="OK"):
+        response = MagicMock()
+        response.status = status
+        response.reason = reason
+        response.headers = {"ETag": '"abc"'}
+        body = io.BytesIO(b"".join(chunks))
+        response.read.side_effect = body.read
+        response.readinto.side_effect = body.readinto
+        pool = MagicMock()
+        pool.request.return_value = response
+        monkeypatch.setattr(installer, "_pool", lambda: pool)
+        return pool, response
+
+    def test_http_get_bytes_uses_pool(self, monkeypatch):
+        """Test _http_get_bytes issues the request through the pool."""
+        pool, response = self._pool_returning(monkeypatch, chunks=[b"test data"])
+        meta = {}
+        
+        result = _http_get_bytes("http://example.com/file", headers={"User-Agent": "test"}, response_headers=meta)
+        
+        assert result == b"test data"
+        assert meta == {"etag": '"abc"'}
+        pool.request.assert_called_once()
+        assert pool.request.call_args.kwargs["headers"] == {"User-Agent": "test"}
+        response.release_conn.assert_called_once()
+
+    def test_http_download_uses_pool(self, monkeypatch, tmp_path):
+        """Test _http_download streams a pooled response to disk."""
+        pool, response = self._pool_returning(monkeypatch, chunks=[b"chunk1", b"chunk2", b""])
+        dest = tmp_path / "file.txt"
+        
+        _http_download("http://example.com/file", dest)
+        
+        assert dest.read_bytes() == b"chunk1chunk2"
+        response.release_conn.assert_called_once()
+
+    def test_pool_error_status_raises_http_error(self, monkeypatch):
+        """Test a non-2xx pooled response raises urllib's HTTPError."""
+        from urllib.error import HTTPError
+        pool, response = self._pool_returning(monkeypatch, status=404, reason="Not Found")
+        
+        with pytest.raises(HTTPError) as excinfo:
+            _http_get_bytes("http://example.com/file")
+        
+        assert excinfo.value.code == 404
+        response.release_conn.assert_called_once()
+
+    def test_proxy_bypasses_pool(self, monkeypatch):
+        """Test a configured proxy sends requests through urllib, since PoolManager ignores it."""
+        monkeypatch.setattr(installer, "_POOL", MagicMock())
+        monkeypatch.setattr(installer.urllib.request, "getproxies", lambda: {"https": "http://proxy:3128"})
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value.read.return_value = b"via proxy"
+        mock_urlopen = Mock(return_value=mock_response)
+        monkeypatch.setattr(installer.urllib.request, "urlopen", mock_urlopen)
+        
+        assert _http_get_bytes("https://example.com/file") == b"via proxy"
+        
+        mock_urlopen.assert_called_once()
+        installer._POOL.request.assert_not_called()
+
+    def test_urllib3_imported_on_first_use(self):
+        """Test importing the CLI doesn't load urllib3; only building the pool does."""
+        import sys
+        src = str(Path(installer.__file__).resolve().parents[1])
+        code = "import sys, neo4j_mcp_installer.cli; print('urllib3' in sys.modules)"
+        
+        out = subprocess.run(
+            [sys.executable, "-c", code], env={**os.environ, "PYTHONPATH": src},
+            capture_output=True, text=True, check=True,
+        ).stdout
+        
+        assert out.strip() == "False"
+
+
+class TestKeepAliveHttp:
+    """Tests for the stdlib keep-alive path used when urllib3 isn't installed."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        """A local HTTP/1.1 server; .ports records the client port of every request."""
+        import re
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        ports = []
+        paths = []
+        blob = bytes(range(256)) * 12  # 3072 bytes
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            drop_after_response = False
+            redirect_to = "/file"
+
+            def do_GET(self):
+                ports.append(self.client_address[1])
+                paths.append(self.path)
+                rng = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+                if self.path == "/redirect":
+                    self.send_response(302)
+                    self.send_header("Location", Handler.redirect_to)
+                    body = b""
+                elif self.path == "/file":
+                    self.send_response(200)
+                    body = b"file body"
+                elif self.path == "/blob" and rng:
+                    a, b = int(rng.group(1)), min(int(rng.group(2)), len(blob) - 1)
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {a}-{b}/{len(blob)}")
+                    body = blob[a:b + 1]
+                else:
+                    self.send_response(404)
+                    body = b"missing"
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                # hang up without announcing it, like an idle-timeout on the server
+                self.close_connection = Handler.drop_after_response
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        thread.start()
+        monkeypatch.setattr(installer, "_pool", lambda: None)
+        monkeypatch.setattr(installer.urllib.request, "getproxies", lambda: {})
+        monkeypatch.setattr(installer, "_CONNS", threading.local())
+        yield SimpleNamespace(
+            url=f"http://127.0.0.1:{httpd.server_address[1]}", ports=ports, paths=paths, blob=blob, handler=Handler
+        )
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_requests_share_one_connection(self, server):
+        """Test consecutive requests to one host reuse the same TCP connection."""
+        assert _http_get_bytes(f"{server.url}/file") == b"file body"
+        assert _http_get_bytes(f"{server.url}/file") == b"file body"
+        
+        assert len(server.ports) == 2
+        assert len(set(server.ports)) == 1
+
+    def test_follows_redirects(self, server):
+        """Test a redirect is followed over the same connection."""
+        assert _http_get_bytes(f"{server.url}/redirect") == b"file body"
+        assert len(server.ports) == 2
+        assert len(set(server.ports)) == 1
+
+    def test_error_status_raises_http_error(self, server):
+        """Test a non-2xx response raises urllib's HTTPError and leaves the connection usable."""
+        from urllib.error import HTTPError
+        with pytest.raises(HTTPError) as excinfo:
+            _http_get_bytes(f"{server.url}/nope")
+        
+        assert excinfo.value.code == 404
+        assert _http_get_bytes(f"{server.url}/file") == b"file body"
+        assert len(set(server.ports)) == 1
+
+    def test_reconnects_after_server_drops_connection(self, server):
+        """Test a kept-alive connection the server has closed is replaced transparently."""
+        server.handler.drop_after_response = True
+        
+        assert _http_get_bytes(f"{server.url}/file") == b"file body"
+        assert _http_get_bytes(f"{server.url}/file") == b"file body"
+        
+        assert len(set(server.ports)) == 2
+
+    @pytest.mark.parametrize("path", ["/blob", "/redirect"])
+    def test_segmented_download(self, server, monkeypatch, tmp_path, path):
+        """Test a Range-segmented, hashed download over keep-alive, segments going to the final URL."""
+        monkeypatch.setattr(installer, "_SEGMENT_THRESHOLD", 1000)
+        monkeypatch.setattr(installer, "_MIN_SEGMENT_SIZE", 400)
+        server.handler.redirect_to = "/blob"
+        dest = tmp_path / "file.bin"
+        hasher = hashlib.sha256()
+        
+        _http_download(f"{server.url}{path}", dest, hasher=hasher)
+        
+        assert dest.read_bytes() == server.blob
+        assert hasher.hexdigest() == hashlib.sha256(server.blob).hexdigest()
+        # the first segment plus three tail segments, after at most one redirect
+        assert server.paths[-4:] == ["/blob"] * 4
+        assert server.paths[:-4] == ([] if path == "/blob" else ["/redirect"])
+
+    def test_proxy_uses_urllib(self, monkeypatch):
+        """Test a configured proxy keeps requests on urllib, which honours it."""
+        monkeypatch.setattr(
+            installer.urllib.request, "getproxies", lambda: {"https": "http://proxy:3128"}
+        )
+        
+        assert not _can_keep_alive("https://github.com/")
+
+
+class TestSegmentedDownload:
+    """Tests for downloading large files as parallel Range segments."""
+
+    @pytest.fixture
+    def fake_server(self, monkeypatch):
+        """Serve a blob through _urlopen, honouring Range headers, and record them."""
+        import contextlib
+        import re
+        import threading
+
+        monkeypatch.setattr(installer, "_SEGMENT_THRESHOLD", 1000)
+        monkeypatch.setattr(installer, "_MIN_SEGMENT_SIZE", 400)
+        server = MagicMock()
+        server.data = bytes(range(256)) * 12  # 3072 bytes
+        server.honour_range = True
+        # misbehaviours: cap 206 replies (or only the tail segments) at this many
+        # bytes, send this Content-Range total (None: no header), cut tails short
+        server.cap = None
+        server.tail_cap = None
+        server.total = None
+        server.no_content_range = False
+        server.short_tail = False
+        server.ranges = []
+        lock = threading.Lock()
+
+        @contextlib.contextmanager
+        def fake_urlopen(url, headers):
+            rng = headers.get("Range")
+            with lock:
+                server.ranges.append(rng)
+            resp = MagicMock()
+            resp.geturl.return_value = url
+            if rng and server.honour_range:
+                a, b = map(int, re.fullmatch(r"bytes=(\d+)-(\d+)", rng).groups())
+                cap = server.cap or (server.tail_cap if a else None) or len(server.data)
+                b = min(b, len(server.data) - 1, a + cap - 1)
+                body = io.BytesIO(server.data[a:b + (0 if a and server.short_tail else 1)])
+                resp.status = 206
+                total = server.total or len(server.data)
+                resp.headers = {} if server.no_content_range else {"Content-Range": f"bytes {a}-{b}/{total}"}
+            else:
+                body = io.BytesIO(server.data)
+                resp.status = 200
+                resp.headers = {}
+            resp.readinto.side_effect = body.readinto
+            yield resp
+
+        monkeypatch.setattr(installer, "_urlopen", fake_urlopen)
+        return server
+
+    def test_large_download_is_split_into_segments(self, fake_server, tmp_path):
+        """Test the tail of a large file is fetched as separate Range requests."""
+        dest = tmp_path / "file.bin"
+        hasher = hashlib.sha256()
+        
+        _http_download("http://example.com/file", dest, hasher=hasher)
+        
+        assert dest.read_bytes() == fake_server.data
+        assert hasher.hexdigest() == hashlib.sha256(fake_server.data).hexdigest()
+        assert sorted(fake_server.ranges) == [
+            "bytes=0-999", "bytes=1000-1690", "bytes=1691-2381", "bytes=2382-3071",
+        ]
+
+    def test_segments_are_hashed_as_they_complete(self, fake_server, tmp_path):
+        """Test the tail is hashed segment by segment instead of re-reading the file at the end."""
+        dest = tmp_path / "file.bin"
+        hasher = hashlib.sha256()
+        
+        with patch.object(installer, "_hash_range", wraps=_hash_range) as mock_hash_range:
+            _http_download("http://example.com/file", dest, hasher=hasher)
+        
+        assert [c.args[1:3] for c in mock_hash_range.call_args_list] == [(1000, 1690), (1691, 2381), (2382, 3071)]
+        assert hasher.hexdigest() == hashlib.sha256(fake_server.data).hexdigest()
+
+    def test_small_download_uses_single_request(self, fake_server, tmp_path):
+        """Test a file within the first segment needs no extra requests."""
+        fake_server.data = b"small file"
+        dest = tmp_path / "file.bin"
+        
+        _http_download("http://example.com/file", dest)
+        
+        assert dest.read_bytes() == b"small file"
+        assert fake_server.ranges == ["bytes=0-999"]
+
+    def test_server_ignoring_range_streams_whole_body(self, fake_server, tmp_path):
+        """Test a 200 reply to the Range request is streamed in full."""
+        fake_server.honour_range = False
+        dest = tmp_path / "file.bin"
+        hasher = hashlib.sha256()
+        
+        _http_download("http://example.com/file", dest, hasher=hasher)
+        
+        assert dest.read_bytes() == fake_server.data
+        assert hasher.hexdigest() == hashlib.sha256(fake_server.data).hexdigest()
+        assert len(fake_server.ranges) == 1
+
+
+    @pytest.mark.parametrize(
+        "misbehaviour",
+        [{"cap": 300}, {"total": "*"}, {"no_content_range": True}],
+        ids=["capped_range", "unknown_total", "no_content_range"],
+    )
+    def test_unusable_partial_response_refetches_whole_file(self, fake_server, tmp_path, misbehaviour):
+        """Test a 206 that isn't the first segment of a known total is never taken for the whole file."""
+        for name, value in misbehaviour.items():
+            setattr(fake_server, name, value)
+        dest = tmp_path / "file.bin"
+        hasher = hashlib.sha256()
+        
+        _http_download("http://example.com/file", dest, hasher=hasher)
+        
+        # the retry carries no Range, so it's answered with the whole body
+        assert dest.read_bytes() == fake_server.data
+        assert hasher.hexdigest() == hashlib.sha256(fake_server.data).hexdigest()
+        assert fake_server.ranges == ["bytes=0-999", None]
+
+    @pytest.mark.parametrize(
+        "misbehaviour, match",
+        [
+            ({"tail_cap": 100}, "Server replied bytes 1000-1099/3072 to a request for bytes 1000-1690/3072"),
+            ({"short_tail": True}, "ended after 690 of 691 bytes"),
+        ],
+        ids=["capped_segment", "short_segment"],
+    )
+    def test_bad_segment_raises(self, fake_server, tmp_path, misbehaviour, match):
+        """Test a tail segment whose Content-Range or length doesn't match the request fails the download."""
+        for name, value in misbehaviour.items():
+            setattr(fake_server, name, value)
+        
+        with pytest.raises(RuntimeError, match=match):
+            _http_download("http://example.com/file", tmp_path / "file.bin")
+
+
+class TestHttpCache:
+    """Tests for conditional GET caching."""
+
+    @patch.object(installer, "_http_get_bytes")
+    def test_http_get_cached_stores_validators(self, mock_http_get, tmp_path):
+        """Test a response with an ETag is written to the cache file."""
+        def respond(url, headers=None, response_headers=None):
+            response_headers["etag"] = '"abc"'
+            return b"body"
+        mock_http_get.side_effect = respond
+        cache_file = tmp_path / "cache" / "entry.json"
+        
+        result = _http_get_cached("http://example.com/file", cache_file)
+        
+        assert result == b"body"
+        stored = json.loads(cache_file.read_text())
+        assert stored["etag"] == '"abc"'
+        assert stored["body"] == "body"
+
+    @patch.object(installer, "_http_get_bytes")
+    def test_http_get_cached_not_modified(self, mock_http_get, tmp_path):
+        """Test a 304 response returns the cached body."""
+        from urllib.error import HTTPError
+        cache_file = tmp_path / "entry.json"
+        cache_file.write_text(json.dumps({
+            "url": "http://example.com/file",
+            "etag": '"abc"',
+            "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "body": "cached body",
+        }))
+        mock_http_get.side_effect = HTTPError("url", 304, "Not Modified", {}, None)
+        
+        result = _http_get_cached("http://example.com/file", cache_file)
+        
+        assert result == b"cached body"
+        sent = mock_http_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"abc"'
+        assert sent["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    @patch.object(installer, "_http_get_bytes")
+    def test_http_get_cached_ignores_entry_for_other_url(self, mock_http_get, tmp_path):
+        """Test a cache entry recorded for a different URL is not used."""
+        cache_file = tmp_path / "entry.json"
+        cache_file.write_text(json.dumps({"url": "http://other", "etag": '"abc"', "body": "old"}))
+        mock_http_get.return_value = b"fresh"
+        
+        result = _http_get_cached("http://example.com/file", cache_file)
+        
+        assert result == b"fresh"
+        assert "If-None-Match" not in mock_http_get.call_args.kwargs["headers"]
+
+    @patch.object(installer, "_http_get_bytes")
+    def test_http_get_cached_fresh_skips_request(self, mock_http_get, tmp_path):
+        """Test a response within its Cache-Control max-age is reused without a request."""
+        def respond(url, headers=None, response_headers=None):
+            response_headers["cache-control"] = "public, max-age=60, s-maxage=60"
+            return b"body"
+        mock_http_get.side_effect = respond
+        cache_file = tmp_path / "entry.json"
+        
+        assert _http_get_cached("http://example.com/file", cache_file) == b"body"
+        assert _http_get_cached("http://example.com/file", cache_file) == b"body"
+        
+        mock_http_get.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            pytest.param({"expires": 0}, id="expired"),
+            pytest.param({}, id="no_expiry"),
+        ],
+    )
+    @patch.object(installer, "_http_get_bytes")
+    def test_http_get_cached_stale_revalidates(self, mock_http_get, entry, tmp_path):
+        """Test a stale cache entry is revalidated rather than reused."""
+        cache_file = tmp_path / "entry.json"
+        cache_file.write_text(json.dumps({"url": "http://example.com/file", "etag": '"abc"', "body": "old", **entry}))
+        mock_http_get.return_value = b"fresh"
+        
+        assert _http_get_cached("http://example.com/file", cache_file) == b"fresh"
+        assert mock_http_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    @pytest.mark.parametrize(
+        "cache_control,fresh",
+        [
+            ("public, max-age=60", True),
+            ("private, max-age=0", False),
+            ("no-cache, max-age=60", False),
+            ("no-store", False),
+            ("", False),
+        ],
+    )
+    def test_fresh_until(self, cache_control, fresh):
+        """Test only a positive max-age without no-cache/no-store makes a response fresh."""
+        assert (_fresh_until(cache_control) is not None) == fresh
+
+    @patch.object(installer, "_http_get_bytes")
+    def test_latest_version_revalidates_with_etag(self, mock_http_get):
+        """Test latest_version reuses the cached release on 304."""
+        from urllib.error import HTTPError
+
+        def respond(url, headers=None, response_headers=None):
+            response_headers["etag"] = '"v1"'
+            return json.dumps({"tag_name": "v1.2.3"}).encode()
+        mock_http_get.side_effect = respond
+        assert latest_version() == "v1.2.3"
+        
+        mock_http_get.side_effect = HTTPError("url", 304, "Not Modified", {}, None)
+        assert latest_version() == "v1.2.3"
+        assert (http_cache_dir() / "latest.json").exists()
+
 
 class TestCryptoHelpers:
     """Tests for cryptographic helper functions."""
@@ -282,9 +818,8 @@ class TestCryptoHelpers:
         assert result == expected
 
     def test_sha256_file_large(self, tmp_path):
-        """Test _sha256_file handles large files in chunks."""
+        """Test _sha256_file handles files of several megabytes."""
         test_file = tmp_path / "large.bin"
-        # Create a file larger than 1MB to test chunking
         test_data = b"x" * (2 * 1024 * 1024)
         test_file.write_bytes(test_data)
         
@@ -293,11 +828,214 @@ class TestCryptoHelpers:
         expected = hashlib.sha256(test_data).hexdigest()
         assert result == expected
 
+    def test_sha256_file_maps_large_files(self, tmp_path):
+        """Test files above the threshold are hashed through mmap."""
+        test_file = tmp_path / "large.bin"
+        test_data = b"x" * (2 * 1024 * 1024)
+        test_file.write_bytes(test_data)
+        
+        with patch.object(installer, "_sha256_mapped", wraps=_sha256_mapped) as mock_mapped:
+            result = _sha256_file(test_file)
+        
+        mock_mapped.assert_called_once()
+        assert result == hashlib.sha256(test_data).hexdigest()
+
+    def test_sha256_file_without_mmap(self, tmp_path):
+        """Test a filesystem that can't mmap falls back to streaming the file."""
+        test_file = tmp_path / "large.bin"
+        test_data = bytes(range(256)) * 8192
+        test_file.write_bytes(test_data)
+        
+        with patch.object(installer.mmap, "mmap", side_effect=OSError("mmap not supported")):
+            result = _sha256_file(test_file)
+        
+        assert result == hashlib.sha256(test_data).hexdigest()
+
+    @pytest.mark.parametrize("test_data", [b"", b"test data for hashing", b"x" * (2 * 1024 * 1024)], ids=["empty", "small", "large"])
+    def test_sha256_mapped(self, tmp_path, test_data):
+        """Test _sha256_mapped, the path _sha256_file takes for files over _MMAP_HASH_THRESHOLD."""
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(test_data)
+        
+        with open(test_file, "rb", buffering=0) as f:
+            result = _sha256_mapped(f)
+        
+        assert result == hashlib.sha256(test_data).hexdigest()
+
+    def test_cached_sha256_file_hit(self, tmp_path):
+        """Test a second lookup of an unchanged file reuses the stored digest."""
+        test_file = tmp_path / "archive.tar.gz"
+        test_file.write_bytes(b"archive bytes")
+        
+        with patch.object(installer, "_sha256_file", wraps=_sha256_file) as mock_sha:
+            first = _cached_sha256_file(test_file)
+            second = _cached_sha256_file(test_file)
+        
+        assert first == second == hashlib.sha256(b"archive bytes").hexdigest()
+        mock_sha.assert_called_once_with(test_file)
+        assert list(checksum_cache_dir().glob("*.json"))
+
+    def test_cached_sha256_file_invalidated_by_change(self, tmp_path):
+        """Test a file whose size or mtime changed is hashed again."""
+        test_file = tmp_path / "archive.tar.gz"
+        test_file.write_bytes(b"archive bytes")
+        _cached_sha256_file(test_file)
+        
+        test_file.write_bytes(b"different archive bytes")
+        
+        assert _cached_sha256_file(test_file) == hashlib.sha256(b"different archive bytes").hexdigest()
+
+    def test_cached_sha256_file_ignores_corrupt_cache(self, tmp_path):
+        """Test an unreadable cache entry falls back to hashing."""
+        test_file = tmp_path / "archive.tar.gz"
+        test_file.write_bytes(b"archive bytes")
+        _cached_sha256_file(test_file)
+        for entry in checksum_cache_dir().glob("*.json"):
+            entry.write_text("not json", encoding="utf-8")
+        
+        assert _cached_sha256_file(test_file) == hashlib.sha256(b"archive bytes").hexdigest()
+
+    @pytest.mark.parametrize("test_data", [b"", b"archive bytes" * 1000], ids=["empty", "data"])
+    def test_crc32_file(self, tmp_path, test_data):
+        """Test _crc32_file agrees with zlib.crc32, including for empty files."""
+        import zlib
+        test_file = tmp_path / "archive.tar.gz"
+        test_file.write_bytes(test_data)
+        
+        assert _crc32_file(test_file) == zlib.crc32(test_data)
+
+    def test_sha256_files_parallel(self, tmp_path):
+        """Test several files are hashed and their digests cached."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"archive{i}.tar.gz"
+            path.write_bytes(b"archive %d" % i)
+            paths.append(path)
+        
+        result = _sha256_files_parallel(paths)
+        
+        assert result == {p: hashlib.sha256(p.read_bytes()).hexdigest() for p in paths}
+        assert len(list(checksum_cache_dir().glob("*.json"))) == 5
+        assert _sha256_files_parallel([]) == {}
+
+
+class TestCopyFile:
+    """Tests for the _copy_file and _install_copy helpers."""
+
+    @pytest.mark.parametrize("kernel_copy", [True, False], ids=["copy_file_range", "copy2"])
+    def test_copy_file(self, kernel_copy, tmp_path, monkeypatch):
+        """Test _copy_file copies data and permissions with and without copy_file_range."""
+        if not kernel_copy:
+            monkeypatch.delattr(os, "copy_file_range", raising=False)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"binary" * 1000)
+        src.chmod(0o750)
+        dst = tmp_path / "dst.bin"
+        
+        _copy_file(src, dst)
+        
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mode == src.stat().st_mode
+
+    def test_copy_file_falls_back_on_os_error(self, tmp_path, monkeypatch):
+        """Test _copy_file falls back to shutil.copy2 when the kernel copy fails."""
+        import errno
+
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"binary")
+        dst = tmp_path / "dst.bin"
+        
+        _copy_file(src, dst)
+        
+        assert dst.read_bytes() == b"binary"
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range not available")
+    def test_copy_file_falls_back_on_short_copy(self, tmp_path, monkeypatch):
+        """Test a kernel copy that stops early is redone with shutil.copy2, not left truncated."""
+        real_copy_file_range = os.copy_file_range
+        calls = []
+
+        def stops_early(src_fd, dst_fd, count, *args):
+            calls.append(count)
+            # copy the first 100 bytes, then report end-of-file
+            return real_copy_file_range(src_fd, dst_fd, min(count, 100)) if len(calls) == 1 else 0
+        monkeypatch.setattr(os, "copy_file_range", stops_early)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"binary" * 1000)
+        dst = tmp_path / "dst.bin"
+        
+        _copy_file(src, dst)
+        
+        assert len(calls) == 2
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_install_copy_replaces_existing(self, tmp_path):
+        """Test _install_copy swaps in an executable copy and leaves no temp file."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"new binary")
+        dst = tmp_path / "install" / "neo4j-mcp"
+        dst.parent.mkdir()
+        dst.write_bytes(b"old binary")
+        
+        _install_copy(src, dst)
+        
+        assert dst.read_bytes() == b"new binary"
+        assert os.name == "nt" or os.access(dst, os.X_OK)
+        assert [p.name for p in dst.parent.iterdir()] == ["neo4j-mcp"]
+
+    def test_install_copy_links_on_same_filesystem(self, tmp_path, monkeypatch):
+        """Test _install_copy hard-links instead of copying when it can."""
+        mock_copy = MagicMock()
+        monkeypatch.setattr(installer, "_copy_file", mock_copy)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"binary")
+        dst = tmp_path / "neo4j-mcp"
+        
+        _install_copy(src, dst)
+        
+        mock_copy.assert_not_called()
+        assert src.exists()
+        assert os.path.samefile(src, dst)
+
+    def test_install_copy_copies_across_filesystems(self, tmp_path, monkeypatch):
+        """Test _install_copy falls back to a real copy when linking fails."""
+        import errno
+
+        def cross_device(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        monkeypatch.setattr(os, "link", cross_device)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"binary")
+        dst = tmp_path / "neo4j-mcp"
+        
+        _install_copy(src, dst)
+        
+        assert dst.read_bytes() == b"binary"
+        assert not os.path.samefile(src, dst)
+
+    def test_install_copy_failure_keeps_existing(self, tmp_path, monkeypatch):
+        """Test a failed copy leaves the installed binary untouched and cleans up."""
+        def fail(src, dst):
+            dst.write_bytes(b"partial")
+            raise OSError("disk full")
+        monkeypatch.setattr(installer, "_copy_file", fail)
+        dst = tmp_path / "neo4j-mcp"
+        dst.write_bytes(b"old binary")
+        
+        with pytest.raises(OSError, match="disk full"):
+            _install_copy(tmp_path / "src.bin", dst)
+        
+        assert dst.read_bytes() == b"old binary"
+        assert not (tmp_path / "neo4j-mcp.tmp").exists()
+
 
 class TestMakeExecutable:
     """Tests for the _make_executable function."""
 
-    @patch("neo4j_mcp_installer.installer.os.name", "posix")
+    @patch.object(installer.os, "name", "posix")
     def test_make_executable_unix(self, tmp_path):
         """Test _make_executable sets executable bits on Unix."""
         test_file = tmp_path / "test.bin"
@@ -312,7 +1050,7 @@ class TestMakeExecutable:
         assert mode & stat.S_IXGRP
         assert mode & stat.S_IXOTH
 
-    @patch("neo4j_mcp_installer.installer.os.name", "nt")
+    @patch.object(installer.os, "name", "nt")
     def test_make_executable_windows(self, tmp_path):
         """Test _make_executable does nothing on Windows."""
         test_file = tmp_path / "test.exe"
@@ -328,7 +1066,7 @@ class TestMakeExecutable:
 class TestLatestVersion:
     """Tests for the latest_version function."""
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_latest_version_success(self, mock_http_get):
         """Test latest_version parses GitHub API response."""
         mock_http_get.return_value = json.dumps({"tag_name": "v1.2.3"}).encode()
@@ -338,7 +1076,7 @@ class TestLatestVersion:
         assert result == "v1.2.3"
         mock_http_get.assert_called_once()
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_latest_version_custom_repo(self, mock_http_get):
         """Test latest_version with custom repo."""
         mock_http_get.return_value = json.dumps({"tag_name": "v2.0.0"}).encode()
@@ -347,7 +1085,23 @@ class TestLatestVersion:
         
         assert result == "v2.0.0"
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
+    def test_latest_version_ignores_tag_name_in_release_notes(self, mock_http_get):
+        """Test a quoted tag_name inside another string value is not picked up."""
+        mock_http_get.return_value = json.dumps(
+            {"body": 'set "tag_name": "v0.0.1" to pin', "tag_name": "v1.2.3"}
+        ).encode()
+        
+        assert latest_version() == "v1.2.3"
+
+    @patch.object(installer, "_http_get_bytes")
+    def test_latest_version_escaped_tag_name(self, mock_http_get):
+        """Test a tag_name containing JSON escapes falls back to a full parse."""
+        mock_http_get.return_value = b'{"tag_name": "v1.2.3-\\u00e9"}'
+        
+        assert latest_version() == "v1.2.3-\u00e9"
+
+    @patch.object(installer, "_http_get_bytes")
     def test_latest_version_no_tag_name(self, mock_http_get):
         """Test latest_version raises error when tag_name is missing."""
         mock_http_get.return_value = json.dumps({"name": "Release"}).encode()
@@ -371,7 +1125,7 @@ class TestNormalizeVersion:
 class TestDownloadChecksums:
     """Tests for checksum download."""
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_download_checksums_success(self, mock_http_get):
         """Test successful checksum download."""
         mock_http_get.return_value = b"checksum data"
@@ -380,7 +1134,7 @@ class TestDownloadChecksums:
         
         assert result == "checksum data"
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_download_checksums_404(self, mock_http_get):
         """Test checksum download returns None on 404."""
         from urllib.error import HTTPError
@@ -390,7 +1144,7 @@ class TestDownloadChecksums:
         
         assert result is None
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_download_checksums_403(self, mock_http_get):
         """Test checksum download returns None on 403."""
         from urllib.error import HTTPError
@@ -400,7 +1154,7 @@ class TestDownloadChecksums:
         
         assert result is None
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_download_checksums_other_http_error(self, mock_http_get):
         """Test checksum download raises on other HTTP errors."""
         from urllib.error import HTTPError
@@ -409,7 +1163,7 @@ class TestDownloadChecksums:
         with pytest.raises(HTTPError):
             _download_checksums_text("v1.2.3", "https://example.com")
 
-    @patch("neo4j_mcp_installer.installer._http_get_bytes")
+    @patch.object(installer, "_http_get_bytes")
     def test_download_checksums_url_error(self, mock_http_get):
         """Test checksum download returns None on URLError."""
         from urllib.error import URLError
@@ -442,6 +1196,32 @@ class TestExpectedShaFromChecksums:
         
         assert result == "abcd1234567890abcdef1234567890abcdef1234567890abcdef1234567890ab"
 
+    def test_parse_checksums_mixed_formats(self):
+        """Test one pass picks up entries in both formats."""
+        sha_a = "a" * 64
+        sha_b = "B" * 64
+        checksums = f"neo4j-mcp_Linux_x86_64.tar.gz\nsha256:{sha_a}\n{sha_b}  neo4j-mcp_Windows_x86_64.zip\n"
+        
+        result = _parse_checksums(checksums)
+        
+        assert result == {
+            "neo4j-mcp_Linux_x86_64.tar.gz": sha_a,
+            "neo4j-mcp_Windows_x86_64.zip": "b" * 64,
+        }
+
+    def test_parse_checksums_crlf_and_blank_lines(self):
+        """Test CRLF endings, blank lines and sha256sum's binary marker are tolerated."""
+        sha_a = "a" * 64
+        sha_b = "b" * 64
+        checksums = f"neo4j-mcp_Linux_x86_64.tar.gz\r\n\r\nsha256:{sha_a}\r\n\r\n{sha_b} *neo4j-mcp_Windows_x86_64.zip\r\n"
+        
+        result = _parse_checksums(checksums)
+        
+        assert result == {
+            "neo4j-mcp_Linux_x86_64.tar.gz": sha_a,
+            "neo4j-mcp_Windows_x86_64.zip": sha_b,
+        }
+
     def test_expected_sha_not_found(self):
         """Test parsing returns None when file not found."""
         checksums = "other_file.tar.gz\nsha256:abcd1234"
@@ -454,6 +1234,11 @@ class TestExpectedShaFromChecksums:
 class TestExtractArchive:
     """Tests for archive extraction."""
 
+    @pytest.fixture(autouse=True)
+    def pure_python(self, monkeypatch):
+        """Exercise tarfile/zipfile; the system-tool tests below opt back out."""
+        monkeypatch.setenv("NEO4J_MCP_PURE_PYTHON", "1")
+
     def test_extract_archive_tar_gz(self, tmp_path):
         """Test extracting from tar.gz archive."""
         # Create a test tar.gz archive
@@ -469,13 +1254,95 @@ class TestExtractArchive:
             tar.addfile(info, io.BytesIO(binary_content))
         
         out_bin = tmp_path / "output" / "neo4j-mcp"
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+        out_bin.parent.mkdir()
+        target = _LINUX_X86_TARGET
         
         _extract_archive(archive_path, out_bin, target)
         
         assert out_bin.exists()
         assert out_bin.read_bytes() == binary_content
 
+    def test_extract_archive_tar_gz_opens_seekable_mode(self, tmp_path):
+        """Test an on-disk tar.gz is read in "r:gz" rather than stream mode."""
+        archive_path = tmp_path / "test.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as tar:
+            info = tarfile.TarInfo(name="neo4j-mcp")
+            info.size = 3
+            tar.addfile(info, io.BytesIO(b"bin"))
+        
+        out_bin = tmp_path / "output" / "neo4j-mcp"
+        out_bin.parent.mkdir()
+        target = _LINUX_X86_TARGET
+        with patch.object(tarfile, "open", wraps=tarfile.open) as mock_open_tar:
+            _extract_archive(archive_path, out_bin, target)
+        
+        assert mock_open_tar.call_args.kwargs["mode"] in ("r:gz", "r:")
+        assert out_bin.read_bytes() == b"bin"
+
+    @pytest.mark.parametrize("backend", ["zlib", "isal"])
+    def test_extract_archive_tar_gz_gzip_backends(self, backend, tmp_path, monkeypatch):
+        """Test tar.gz extraction through both the stdlib and the isal gzip reader."""
+        if backend == "isal":
+            igzip = pytest.importorskip("isal.igzip")
+            monkeypatch.setattr(installer, "_igzip", lambda: igzip)
+        else:
+            monkeypatch.setattr(installer, "_igzip", lambda: None)
+        archive_path = tmp_path / "test.tar.gz"
+        binary_content = bytes(range(256)) * 4096
+        with tarfile.open(archive_path, "w:gz") as tar:
+            readme = tarfile.TarInfo(name="dist/README.md")
+            readme.size = 6
+            tar.addfile(readme, io.BytesIO(b"readme"))
+            info = tarfile.TarInfo(name="dist/neo4j-mcp")
+            info.size = len(binary_content)
+            tar.addfile(info, io.BytesIO(binary_content))
+        
+        out_bin = tmp_path / "neo4j-mcp"
+        target = _LINUX_X86_TARGET
+        _extract_archive(archive_path, out_bin, target)
+        
+        assert out_bin.read_bytes() == binary_content
+
+    def test_extract_archive_tar_gz_nested_after_other_members(self, tmp_path):
+        """Test the tar.gz stream is scanned past other members to the binary."""
+        archive_path = tmp_path / "test.tar.gz"
+        binary_content = b"fake binary content"
+        
+        with tarfile.open(archive_path, "w:gz") as tar:
+            import io
+            import tarfile as tf
+            
+            readme = tf.TarInfo(name="dist/README.md")
+            readme.size = 6
+            tar.addfile(readme, io.BytesIO(b"readme"))
+            info = tf.TarInfo(name="dist/neo4j-mcp")
+            info.size = len(binary_content)
+            tar.addfile(info, io.BytesIO(binary_content))
+        
+        out_bin = tmp_path / "output" / "neo4j-mcp"
+        out_bin.parent.mkdir()
+        target = _LINUX_X86_TARGET
+        
+        _extract_archive(archive_path, out_bin, target)
+        
+        assert out_bin.read_bytes() == binary_content
+
+    @pytest.mark.parametrize("order", [("neo4j-mcp.exe", "neo4j-mcp"), ("neo4j-mcp", "neo4j-mcp.exe")])
+    def test_extract_archive_tar_gz_prefers_target_name(self, tmp_path, order):
+        """Test a tar.gz holding both binary names yields the target's, wherever it sits, as for zip."""
+        archive_path = tmp_path / "test.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as tar:
+            for name in order:
+                info = tarfile.TarInfo(name=f"dist/{name}")
+                info.size = len(name)
+                tar.addfile(info, io.BytesIO(name.encode()))
+        
+        out_bin = tmp_path / "neo4j-mcp"
+        _extract_archive(archive_path, out_bin, _LINUX_X86_TARGET)
+        
+        assert out_bin.read_bytes() == b"neo4j-mcp"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["neo4j-mcp", "test.tar.gz"]
+
     def test_extract_archive_zip(self, tmp_path):
         """Test extracting from zip archive."""
         # Create a test zip archive
@@ -486,6 +1353,7 @@ class TestExtractArchive:
             zf.writestr("neo4j-mcp.exe", binary_content)
         
         out_bin = tmp_path / "output" / "neo4j-mcp.exe"
+        out_bin.parent.mkdir()
         target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
         
         _extract_archive(archive_path, out_bin, target)
@@ -493,6 +1361,22 @@ class TestExtractArchive:
         assert out_bin.exists()
         assert out_bin.read_bytes() == binary_content
 
+    def test_extract_archive_zip_large_compressed_member(self, tmp_path):
+        """Test a deflated zip member larger than one read is extracted intact."""
+        archive_path = tmp_path / "test.zip"
+        binary_content = os.urandom(256 * 1024) * 12  # 3 MiB, compressible
+        
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("neo4j-mcp.exe", binary_content)
+        
+        out_bin = tmp_path / "output" / "neo4j-mcp.exe"
+        out_bin.parent.mkdir()
+        target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
+        
+        _extract_archive(archive_path, out_bin, target)
+        
+        assert out_bin.read_bytes() == binary_content
+
     def test_extract_archive_tar_gz_binary_not_found(self, tmp_path):
         """Test extraction fails when binary not found in tar.gz."""
         archive_path = tmp_path / "test.tar.gz"
@@ -507,7 +1391,8 @@ class TestExtractArchive:
             tar.addfile(info, io.BytesIO(content))
         
         out_bin = tmp_path / "output" / "neo4j-mcp"
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
+        out_bin.parent.mkdir()
+        target = _LINUX_X86_TARGET
         
         with pytest.raises(RuntimeError, match="Could not find neo4j-mcp binary"):
             _extract_archive(archive_path, out_bin, target)
@@ -520,294 +1405,532 @@ class TestExtractArchive:
             zf.writestr("wrong_file.exe", b"test")
         
         out_bin = tmp_path / "output" / "neo4j-mcp.exe"
+        out_bin.parent.mkdir()
         target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
         
         with pytest.raises(RuntimeError, match="Could not find neo4j-mcp binary"):
             _extract_archive(archive_path, out_bin, target)
 
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_extract_archive_sends_fadvise_hints(self, tmp_path, monkeypatch):
+        """Test the archive is read with SEQUENTIAL and released with DONTNEED."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zf:
+            zf.writestr("neo4j-mcp.exe", b"fake binary content")
+        advice = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, hint: advice.append(hint))
+        
+        out_bin = tmp_path / "neo4j-mcp.exe"
+        target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
+        _extract_archive(archive_path, out_bin, target)
+        
+        assert advice == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+
     def test_extract_archive_unsupported_type(self, tmp_path):
         """Test extraction fails for unsupported archive type."""
         archive_path = tmp_path / "test.rar"
         archive_path.touch()
         
         out_bin = tmp_path / "output" / "neo4j-mcp"
+        out_bin.parent.mkdir()
         target = Target(os_name="Linux", arch="x86_64", archive_ext=".rar")
         
         with pytest.raises(RuntimeError, match="Unsupported archive type"):
             _extract_archive(archive_path, out_bin, target)
 
 
+class TestSystemToolExtraction:
+    """Tests for extracting with the system tar / unzip."""
+
+    @staticmethod
+    def make_tar(path: Path, name: str = "dist/neo4j-mcp", content: bytes = b"fake binary content") -> None:
+        with tarfile.open(path, "w:gz") as tar:
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    @patch.object(installer.shutil, "which", return_value="/usr/bin/fake-tar")
+    def test_extract_archive_uses_system_tar(self, mock_which, tmp_path, monkeypatch):
+        """Test a found tar binary is invoked and its output moved into place."""
+        monkeypatch.delenv("NEO4J_MCP_PURE_PYTHON", raising=False)
+        archive = tmp_path / "test.tar.gz"
+        archive.write_bytes(b"not really a tarball")
+        out_bin = tmp_path / "out" / "neo4j-mcp"
+        out_bin.parent.mkdir()
+        
+        def fake_tar(cmd, **kwargs):
+            dest = Path(cmd[cmd.index("-C") + 1])
+            (dest / "dist").mkdir()
+            (dest / "dist" / "neo4j-mcp").write_bytes(b"from system tar")
+        
+        target = _LINUX_X86_TARGET
+        with patch.object(subprocess, "run", side_effect=fake_tar) as mock_run:
+            _extract_archive(archive, out_bin, target)
+        
+        mock_which.assert_called_with("tar")
+        assert mock_run.call_args.args[0][:3] == ["/usr/bin/fake-tar", "-xzf", str(archive)]
+        assert out_bin.read_bytes() == b"from system tar"
+        # the scratch directory is cleaned up
+        assert [p.name for p in out_bin.parent.iterdir()] == ["neo4j-mcp"]
+
+    @pytest.mark.parametrize("tool, ext", [("tar", ".tar.gz"), ("unzip", ".zip")])
+    def test_extract_archive_with_real_tool(self, tool, ext, tmp_path, monkeypatch):
+        """Test extraction through the tool actually installed on this machine."""
+        if shutil.which(tool) is None:
+            pytest.skip(f"{tool} not available")
+        monkeypatch.delenv("NEO4J_MCP_PURE_PYTHON", raising=False)
+        archive = tmp_path / f"test{ext}"
+        if ext == ".zip":
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.writestr("README.md", b"readme")
+                zf.writestr("neo4j-mcp.exe", b"fake binary content")
+            target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
+            out_bin = tmp_path / "out" / "neo4j-mcp.exe"
+        else:
+            self.make_tar(archive)
+            target = _LINUX_X86_TARGET
+            out_bin = tmp_path / "out" / "neo4j-mcp"
+        out_bin.parent.mkdir()
+        
+        with patch.object(installer, "_extract_with_python") as mock_python:
+            _extract_archive(archive, out_bin, target)
+        
+        mock_python.assert_not_called()
+        assert out_bin.read_bytes() == b"fake binary content"
+
+    @patch.object(installer.shutil, "which", return_value="/usr/bin/fake-tar")
+    def test_extract_archive_falls_back_when_tool_fails(self, mock_which, tmp_path, monkeypatch):
+        """Test a failing system tar falls back to tarfile."""
+        
+        monkeypatch.delenv("NEO4J_MCP_PURE_PYTHON", raising=False)
+        archive = tmp_path / "test.tar.gz"
+        self.make_tar(archive)
+        out_bin = tmp_path / "out" / "neo4j-mcp"
+        out_bin.parent.mkdir()
+        
+        target = _LINUX_X86_TARGET
+        with patch.object(subprocess, "run", side_effect=subprocess.CalledProcessError(2, "tar")):
+            _extract_archive(archive, out_bin, target)
+        
+        assert out_bin.read_bytes() == b"fake binary content"
+        assert [p.name for p in out_bin.parent.iterdir()] == ["neo4j-mcp"]
+
+    @patch.object(installer.shutil, "which")
+    def test_pure_python_opt_out(self, mock_which, tmp_path, monkeypatch):
+        """Test NEO4J_MCP_PURE_PYTHON skips the system tools entirely."""
+        monkeypatch.setenv("NEO4J_MCP_PURE_PYTHON", "1")
+        archive = tmp_path / "test.tar.gz"
+        self.make_tar(archive)
+        out_bin = tmp_path / "neo4j-mcp"
+        
+        _extract_archive(archive, out_bin, _LINUX_X86_TARGET)
+        
+        mock_which.assert_not_called()
+        assert out_bin.read_bytes() == b"fake binary content"
+
+
+class TestDownloadAndExtract:
+    """Tests for extracting straight from the HTTP response."""
+
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        """Serve the given archive bytes from _urlopen and record requested URLs."""
+        requested = []
+
+        def install(payload: bytes):
+            @contextlib.contextmanager
+            def fake_urlopen(url, headers):
+                requested.append(url)
+                yield io.BytesIO(payload)
+
+            monkeypatch.setattr(installer, "_urlopen", fake_urlopen)
+            return requested
+
+        return install
+
+    def test_download_and_extract_tar_gz(self, serve, tmp_path):
+        """Test the binary is pulled out of a streamed tar.gz response."""
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            info = tarfile.TarInfo(name="dist/neo4j-mcp")
+            info.size = len(b"fake binary content")
+            tar.addfile(info, io.BytesIO(b"fake binary content"))
+        requested = serve(buf.getvalue())
+        
+        out_bin = tmp_path / "neo4j-mcp"
+        target = _LINUX_X86_TARGET
+        _download_and_extract("https://example.com/v1.0.0/neo4j-mcp_Linux_x86_64.tar.gz", out_bin, target)
+        
+        assert out_bin.read_bytes() == b"fake binary content"
+        assert requested == ["https://example.com/v1.0.0/neo4j-mcp_Linux_x86_64.tar.gz"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["neo4j-mcp"]
+
+    def test_download_and_extract_tar_gz_prefers_target_name(self, serve, tmp_path):
+        """Test a streamed tar.gz replaces an earlier other-named binary with the target's."""
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            for name in ("neo4j-mcp.exe", "neo4j-mcp"):
+                info = tarfile.TarInfo(name=name)
+                info.size = len(name)
+                tar.addfile(info, io.BytesIO(name.encode()))
+        serve(buf.getvalue())
+        
+        out_bin = tmp_path / "neo4j-mcp"
+        _download_and_extract("https://example.com/v1.0.0/neo4j-mcp_Linux_x86_64.tar.gz", out_bin, _LINUX_X86_TARGET)
+        
+        assert out_bin.read_bytes() == b"neo4j-mcp"
+
+    def test_download_and_extract_zip(self, serve, tmp_path):
+        """Test the binary is pulled out of a spooled zip response."""
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("neo4j-mcp.exe", b"fake binary content")
+        serve(buf.getvalue())
+        
+        out_bin = tmp_path / "neo4j-mcp.exe"
+        target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
+        _download_and_extract("https://example.com/v1.0.0/neo4j-mcp_Windows_x86_64.zip", out_bin, target)
+        
+        assert out_bin.read_bytes() == b"fake binary content"
+
+    def test_download_and_extract_missing_binary(self, serve, tmp_path):
+        """Test a streamed archive without the binary raises."""
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("README.md", b"readme")
+        serve(buf.getvalue())
+        
+        target = Target(os_name="Windows", arch="x86_64", archive_ext=".zip")
+        with pytest.raises(RuntimeError, match="Could not find neo4j-mcp binary inside neo4j-mcp_Windows_x86_64.zip"):
+            _download_and_extract("https://example.com/v1.0.0/neo4j-mcp_Windows_x86_64.zip", tmp_path / "neo4j-mcp.exe", target)
+
+
+class TestAtomicOutput:
+    """Tests for writing the extracted binary atomically."""
+
+    @pytest.fixture(params=["o_tmpfile", "rename"])
+    def mode(self, request, monkeypatch):
+        """Run each test with O_TMPFILE (where available) and with tmp + rename."""
+        if request.param == "rename":
+            monkeypatch.setattr(installer, "_open_tmpfile", lambda directory: None)
+        return request.param
+
+    def test_atomic_output_replaces_existing_file(self, mode, tmp_path):
+        """Test the new content replaces an existing file and no temp file is left."""
+        out_bin = tmp_path / "neo4j-mcp"
+        out_bin.write_bytes(b"old")
+        
+        with _atomic_output(out_bin) as f:
+            f.write(b"new")
+        
+        assert out_bin.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["neo4j-mcp"]
+
+    def test_atomic_output_leaves_nothing_on_failure(self, mode, tmp_path):
+        """Test a failed write never creates the output file."""
+        out_bin = tmp_path / "neo4j-mcp"
+        
+        with pytest.raises(RuntimeError):
+            with _atomic_output(out_bin) as f:
+                f.write(b"partial")
+                raise RuntimeError("extraction failed")
+        
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def installer_env(monkeypatch, tmp_path):
+    """
+    Replace the network / extraction steps install_binary drives, one setattr each.
+    Defaults: latest release v1.0.0 for Linux x86_64, installing into tmp_path / "install";
+    the download writes (and hashes) b"fake archive" and extraction writes b"fake binary".
+    """
+    target = _LINUX_X86_TARGET
+    archive = tmp_path / "archive" / "neo4j-mcp_Linux_x86_64.tar.gz"
+    archive.parent.mkdir()
+    extracted = tmp_path / "extracted" / "neo4j-mcp"
+    extracted.parent.mkdir()
+
+    def create_archive(url, dest, hasher=None, **kwargs):
+        dest.write_bytes(b"fake archive")
+        if hasher is not None:
+            hasher.update(b"fake archive")
+
+    # plain Mocks: none of these need magic methods, and spec= keeps
+    # assert_called_with matching positional and keyword arguments alike
+    env = SimpleNamespace(
+        target=target,
+        archive=archive,
+        extracted=extracted,
+        install_dir=tmp_path / "install",
+        detect_target=Mock(spec=installer.detect_target, return_value=target),
+        latest_version=Mock(spec=installer.latest_version, return_value="v1.0.0"),
+        default_install_dir=Mock(spec=installer.default_install_dir, return_value=tmp_path / "install"),
+        extracted_path=Mock(spec=installer.extracted_path, return_value=extracted),
+        archive_path=Mock(spec=installer.archive_path, return_value=archive),
+        _http_download=Mock(spec=installer._http_download, side_effect=create_archive),
+        _download_checksums_text=Mock(spec=installer._download_checksums_text, return_value=None),
+        _extract_archive=Mock(
+            spec=installer._extract_archive, side_effect=lambda *args, **kwargs: extracted.write_bytes(b"fake binary")
+        ),
+        _make_executable=Mock(spec=installer._make_executable, wraps=_make_executable),
+    )
+    for name in (
+        "detect_target", "latest_version", "default_install_dir", "extracted_path", "archive_path",
+        "_http_download", "_download_checksums_text", "_extract_archive", "_make_executable",
+    ):
+        monkeypatch.setattr(installer, name, getattr(env, name))
+    return env
+
+
 class TestInstallBinary:
     """Tests for the install_binary function."""
 
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.latest_version")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    @patch("neo4j_mcp_installer.installer.archive_path")
-    @patch("neo4j_mcp_installer.installer._http_download")
-    @patch("neo4j_mcp_installer.installer._download_checksums_text")
-    @patch("neo4j_mcp_installer.installer._extract_archive")
-    @patch("neo4j_mcp_installer.installer._make_executable")
-    def test_install_binary_basic(
-        self, mock_make_exec, mock_extract, mock_checksums,
-        mock_download, mock_archive_path, mock_extracted_path, mock_default_dir,
-        mock_latest, mock_detect, tmp_path
-    ):
+    def test_install_binary_basic(self, installer_env):
         """Test basic install_binary flow."""
-        # Setup mocks
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        mock_latest.return_value = "v1.0.0"
-        
-        install_dir = tmp_path / "install"
-        install_dir.mkdir(parents=True, exist_ok=True)
-        mock_default_dir.return_value = install_dir
-        
-        # Setup archive path
-        archive = tmp_path / "archive" / "test.tar.gz"
-        archive.parent.mkdir(parents=True, exist_ok=True)
-        mock_archive_path.return_value = archive
-        
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        extracted.parent.mkdir(parents=True)
-        # Don't create extracted yet - let the test flow create it
-        mock_extracted_path.return_value = extracted
-        
-        mock_checksums.return_value = None  # No checksums available
-        
-        # Make download create the temp archive file
-        def create_archive(url, dest, **kwargs):
-            dest.write_bytes(b"fake archive")
-        mock_download.side_effect = create_archive
-        
-        # Make extract create the extracted file
-        def create_extracted(*args, **kwargs):
-            extracted.write_bytes(b"fake binary")
-        mock_extract.side_effect = create_extracted
-        
-        # Run install
         final_path, version, extracted_bin = install_binary()
         
-        # Verify
         assert version == "v1.0.0"
-        assert extracted_bin == extracted
+        assert extracted_bin == installer_env.extracted
         assert final_path.exists()
-        mock_download.assert_called_once()
-        mock_extract.assert_called_once()
-
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    @patch("neo4j_mcp_installer.installer._http_download")
-    @patch("neo4j_mcp_installer.installer._download_checksums_text")
-    @patch("neo4j_mcp_installer.installer._extract_archive")
-    @patch("neo4j_mcp_installer.installer._make_executable")
-    def test_install_binary_with_version(
-        self, mock_make_exec, mock_extract, mock_checksums,
-        mock_download, mock_extracted_path, mock_default_dir,
-        mock_detect, tmp_path
-    ):
-        """Test install_binary with specific version."""
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        
-        install_dir = tmp_path / "install"
-        install_dir.mkdir(parents=True, exist_ok=True)
-        mock_default_dir.return_value = install_dir
-        
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        extracted.parent.mkdir(parents=True)
-        extracted.write_bytes(b"fake binary")
-        mock_extracted_path.return_value = extracted
-        mock_checksums.return_value = None
+        installer_env._http_download.assert_called_once()
+        installer_env._extract_archive.assert_called_once()
+
+    def test_install_binary_idempotent(self, installer_env, monkeypatch):
+        """Test a second install of the same version downloads and copies nothing."""
+        mock_copy = Mock(spec=_install_copy, wraps=_install_copy)
+        monkeypatch.setattr(installer, "_install_copy", mock_copy)
+        
+        first = install_binary(version="v1.0.0")
+        second = install_binary(version="v1.0.0")
+        
+        assert first == second
+        installer_env._http_download.assert_called_once()
+        mock_copy.assert_called_once()
+        assert second[0].read_bytes() == b"fake binary"
+        
+        # a force re-download still replaces the installed copy
+        install_binary(version="v1.0.0", force_download=True)
+        assert installer_env._http_download.call_count == 2
+        assert mock_copy.call_count == 2
+
+    @pytest.mark.parametrize("link", [True, False], ids=["hard_link", "copy"])
+    def test_install_binary_switches_version_with_same_stat(self, installer_env, monkeypatch, tmp_path, link):
+        """Test another version's binary with equal size and mtime (as tar -x leaves them) is still installed."""
+        import errno
+        if not link:
+            def no_link(src, dst):
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            monkeypatch.setattr(os, "link", no_link)
+        for version in ("v1.0.0", "v2.0.0"):
+            binary = tmp_path / version / "neo4j-mcp"
+            binary.parent.mkdir()
+            binary.write_bytes(f"binary {version}".encode())
+            os.utime(binary, ns=(1_700_000_000_000_000_000,) * 2)
+        installer_env.extracted_path.side_effect = lambda version, target: tmp_path / version / "neo4j-mcp"
+        mock_copy = Mock(spec=_install_copy, wraps=_install_copy)
+        monkeypatch.setattr(installer, "_install_copy", mock_copy)
+        
+        install_binary(version="v1.0.0")
+        final_path, _, _ = install_binary(version="v2.0.0")
+        
+        assert final_path.read_bytes() == b"binary v2.0.0"
+        assert mock_copy.call_count == 2
+        
+        # the same version again is recognised, by inode or by the install record
+        install_binary(version="v2.0.0")
+        assert mock_copy.call_count == 2
+
+    @pytest.mark.parametrize(
+        "kwargs,env,expected_version",
+        [
+            pytest.param({"version": "v2.5.0"}, {}, "v2.5.0", id="explicit_version"),
+            pytest.param({}, {"NEO4J_MCP_VERSION": "v3.0.0"}, "v3.0.0", id="env_version"),
+            pytest.param({"verify": True}, {"NEO4J_MCP_SKIP_VERIFY": "1"}, "v1.0.0", id="skip_verify"),
+            pytest.param({"force_download": False}, {}, "v1.0.0", id="latest"),
+        ],
+    )
+    def test_install_binary_reuses_extracted(self, installer_env, monkeypatch, kwargs, env, expected_version):
+        """Test an already extracted version is installed without downloading, extracting or verifying."""
+        installer_env.extracted.write_bytes(b"existing binary")
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        
+        final_path, version, extracted_bin = install_binary(**kwargs)
+        
+        assert version == expected_version
+        assert final_path.read_bytes() == b"existing binary"
+        assert extracted_bin == installer_env.extracted
+        # latest_version should only be asked when no version was pinned
+        pinned = "version" in kwargs or "NEO4J_MCP_VERSION" in env
+        assert installer_env.latest_version.called is not pinned
+        installer_env._http_download.assert_not_called()
+        installer_env._extract_archive.assert_not_called()
+        installer_env._download_checksums_text.assert_not_called()
+
+    def test_install_binary_with_verification(self, installer_env, monkeypatch):
+        """Test install_binary with checksum verification."""
+        mock_sha = MagicMock()
+        monkeypatch.setattr(installer, "_sha256_file", mock_sha)
+        mock_expected_sha = MagicMock(return_value=hashlib.sha256(b"fake archive").hexdigest())
+        monkeypatch.setattr(installer, "_expected_sha_from_checksums", mock_expected_sha)
+        installer_env._download_checksums_text.return_value = "checksum data"
         
-        final_path, version, extracted_bin = install_binary(version="v2.5.0")
+        final_path, version, extracted_bin = install_binary(verify=True)
         
-        assert version == "v2.5.0"
+        # The digest comes from the download itself; the archive is never re-read
+        mock_sha.assert_not_called()
+        mock_expected_sha.assert_called_once()
         assert final_path.exists()
 
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.latest_version")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    def test_install_binary_uses_env_version(
-        self, mock_extracted_path, mock_default_dir, mock_latest, mock_detect, tmp_path
-    ):
-        """Test install_binary uses NEO4J_MCP_VERSION environment variable."""
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        
-        install_dir = tmp_path / "install"
-        install_dir.mkdir(parents=True, exist_ok=True)
-        mock_default_dir.return_value = install_dir
-        
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        extracted.parent.mkdir(parents=True)
-        extracted.write_bytes(b"fake binary")
-        mock_extracted_path.return_value = extracted
-        
-        with patch.dict(os.environ, {"NEO4J_MCP_VERSION": "v3.0.0"}):
-            with patch("neo4j_mcp_installer.installer._http_download"):
-                with patch("neo4j_mcp_installer.installer._extract_archive"):
-                    with patch("neo4j_mcp_installer.installer._make_executable"):
-                        with patch("neo4j_mcp_installer.installer._download_checksums_text", return_value=None):
-                            final_path, version, extracted_bin = install_binary()
-        
-        assert version == "v3.0.0"
-        # latest_version should not be called when env var is set
-        mock_latest.assert_not_called()
-
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.latest_version")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    @patch("neo4j_mcp_installer.installer.archive_path")
-    @patch("neo4j_mcp_installer.installer._http_download")
-    @patch("neo4j_mcp_installer.installer._download_checksums_text")
-    @patch("neo4j_mcp_installer.installer._expected_sha_from_checksums")
-    @patch("neo4j_mcp_installer.installer._sha256_file")
-    @patch("neo4j_mcp_installer.installer._extract_archive")
-    @patch("neo4j_mcp_installer.installer._make_executable")
-    def test_install_binary_with_verification(
-        self, mock_make_exec, mock_extract, mock_sha, mock_expected_sha,
-        mock_checksums, mock_download, mock_archive_path, mock_extracted_path, mock_default_dir,
-        mock_latest, mock_detect, tmp_path
-    ):
-        """Test install_binary with checksum verification."""
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        mock_latest.return_value = "v1.0.0"
-        
-        install_dir = tmp_path / "install"
-        install_dir.mkdir(parents=True, exist_ok=True)
-        mock_default_dir.return_value = install_dir
+    def test_install_binary_fetches_checksums_during_download(self, installer_env):
+        """Test the checksums request runs concurrently with the archive download."""
+        import threading
+        checksums_requested = threading.Event()
         
-        # Setup archive path
-        archive = tmp_path / "archive" / "test.tar.gz"
-        archive.parent.mkdir(parents=True, exist_ok=True)
-        mock_archive_path.return_value = archive
+        def fetch_checksums(**kwargs):
+            checksums_requested.set()
+            return None
+        installer_env._download_checksums_text.side_effect = fetch_checksums
         
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        extracted.parent.mkdir(parents=True)
-        # Don't create extracted yet - let the test flow create it
-        mock_extracted_path.return_value = extracted
-        
-        # Make download create the temp archive file
+        # The download only finishes once the checksums request has started
         def create_archive(url, dest, **kwargs):
+            assert checksums_requested.wait(timeout=5)
             dest.write_bytes(b"fake archive")
-        mock_download.side_effect = create_archive
-        
-        # Make extract create the file
-        def create_extracted(*args, **kwargs):
-            extracted.write_bytes(b"fake binary")
-        mock_extract.side_effect = create_extracted
-        
-        mock_checksums.return_value = "checksum data"
-        expected_hash = "abcd1234567890abcdef1234567890abcdef1234567890abcdef1234567890ab"
-        mock_expected_sha.return_value = expected_hash
-        mock_sha.return_value = expected_hash
+        installer_env._http_download.side_effect = create_archive
         
         final_path, version, extracted_bin = install_binary(verify=True)
         
-        mock_sha.assert_called_once()
-        mock_expected_sha.assert_called_once()
+        installer_env._download_checksums_text.assert_called_once_with(version="v1.0.0", base_url=DEFAULT_BASE_URL)
         assert final_path.exists()
 
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.latest_version")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    @patch("neo4j_mcp_installer.installer._http_download")
-    @patch("neo4j_mcp_installer.installer._download_checksums_text")
-    @patch("neo4j_mcp_installer.installer._expected_sha_from_checksums")
-    @patch("neo4j_mcp_installer.installer._sha256_file")
-    def test_install_binary_verification_fails(
-        self, mock_sha, mock_expected_sha, mock_checksums, mock_download,
-        mock_extracted_path, mock_default_dir, mock_latest, mock_detect, tmp_path
-    ):
-        """Test install_binary fails when checksum doesn't match."""
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        mock_latest.return_value = "v1.0.0"
-        mock_default_dir.return_value = tmp_path / "install"
-        
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        mock_extracted_path.return_value = extracted
-        
-        mock_checksums.return_value = "checksum data"
-        mock_expected_sha.return_value = "expected_hash_12345"
-        mock_sha.return_value = "actual_hash_67890"
-        
-        with pytest.raises(RuntimeError, match="Checksum verification failed"):
-            install_binary(verify=True)
-
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.latest_version")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    @patch("neo4j_mcp_installer.installer._http_download")
-    @patch("neo4j_mcp_installer.installer._download_checksums_text")
-    @patch("neo4j_mcp_installer.installer._extract_archive")
-    @patch("neo4j_mcp_installer.installer._make_executable")
-    def test_install_binary_skip_verification_with_env(
-        self, mock_make_exec, mock_extract, mock_checksums,
-        mock_download, mock_extracted_path, mock_default_dir,
-        mock_latest, mock_detect, tmp_path
-    ):
-        """Test install_binary skips verification with NEO4J_MCP_SKIP_VERIFY."""
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        mock_latest.return_value = "v1.0.0"
-        
-        install_dir = tmp_path / "install"
-        install_dir.mkdir(parents=True, exist_ok=True)
-        mock_default_dir.return_value = install_dir
+    @pytest.mark.parametrize("cached_matches", [True, False], ids=["match", "stale"])
+    def test_install_binary_reuses_verified_archive(self, installer_env, cached_matches):
+        """Test a cached archive matching checksums.txt is not downloaded again."""
+        archive = installer_env.archive
+        archive.write_bytes(b"fake archive" if cached_matches else b"corrupt archive")
+        sha = hashlib.sha256(b"fake archive").hexdigest()
+        installer_env._download_checksums_text.return_value = f"neo4j-mcp_Linux_x86_64.tar.gz\nsha256:{sha}\n"
         
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        extracted.parent.mkdir(parents=True)
-        extracted.write_bytes(b"fake binary")
-        mock_extracted_path.return_value = extracted
+        final_path, version, extracted_bin = install_binary(verify=True, force_download=True)
         
-        mock_checksums.return_value = "checksum data"
-        
-        with patch.dict(os.environ, {"NEO4J_MCP_SKIP_VERIFY": "1"}):
-            final_path, version, extracted_bin = install_binary(verify=True)
-        
-        # Checksums should not be downloaded when skip verify is set
-        mock_checksums.assert_not_called()
+        assert installer_env._http_download.called is not cached_matches
+        installer_env._download_checksums_text.assert_called_once()
+        installer_env._extract_archive.assert_called_once()
+        assert archive.read_bytes() == b"fake archive"
         assert final_path.exists()
 
-    @patch("neo4j_mcp_installer.installer.detect_target")
-    @patch("neo4j_mcp_installer.installer.latest_version")
-    @patch("neo4j_mcp_installer.installer.default_install_dir")
-    @patch("neo4j_mcp_installer.installer.extracted_path")
-    @patch("neo4j_mcp_installer.installer._http_download")
-    @patch("neo4j_mcp_installer.installer._extract_archive")
-    @patch("neo4j_mcp_installer.installer._make_executable")
-    def test_install_binary_reuses_extracted(
-        self, mock_make_exec, mock_extract, mock_download,
-        mock_extracted_path, mock_default_dir, mock_latest, mock_detect, tmp_path
-    ):
-        """Test install_binary reuses already extracted binary."""
-        target = Target(os_name="Linux", arch="x86_64", archive_ext=".tar.gz")
-        mock_detect.return_value = target
-        mock_latest.return_value = "v1.0.0"
+    def test_install_binary_size_mismatch_skips_hash(self, installer_env, monkeypatch):
+        """Test a cached archive whose size changed since it verified is re-downloaded unhashed."""
+        sha = hashlib.sha256(b"fake archive").hexdigest()
+        installer_env._download_checksums_text.return_value = f"neo4j-mcp_Linux_x86_64.tar.gz\nsha256:{sha}\n"
+        install_binary(verify=True)
+        # the archive gets truncated after it was verified and recorded, and
+        # the extracted binary goes missing, so the archive is checked for reuse
+        installer_env.archive.write_bytes(b"fake")
+        installer_env.extracted.unlink()
+        mock_sha = Mock(spec=_sha256_file, wraps=_sha256_file)
+        monkeypatch.setattr(installer, "_sha256_file", mock_sha)
+        
+        install_binary(verify=True)
+        
+        mock_sha.assert_not_called()
+        assert installer_env._http_download.call_count == 2
+        assert installer_env.archive.read_bytes() == b"fake archive"
+
+    @staticmethod
+    def _corrupt_in_place(path):
+        # same size, same mtime: only the bytes changed
+        st = path.stat()
+        path.write_bytes(b"fake archivX")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def test_install_binary_force_rehashes_cached_archive(self, installer_env, monkeypatch):
+        """Test a forced install reads the cached archive instead of trusting the digest cache."""
+        sha = hashlib.sha256(b"fake archive").hexdigest()
+        installer_env._download_checksums_text.return_value = f"neo4j-mcp_Linux_x86_64.tar.gz\nsha256:{sha}\n"
+        install_binary(verify=True)
+        self._corrupt_in_place(installer_env.archive)
+        mock_sha = Mock(spec=_sha256_file, wraps=_sha256_file)
+        monkeypatch.setattr(installer, "_sha256_file", mock_sha)
+        
+        install_binary(verify=True, force_download=True)
         
-        install_dir = tmp_path / "install"
-        install_dir.mkdir(parents=True, exist_ok=True)
-        mock_default_dir.return_value = install_dir
-        
-        # Simulate already extracted binary
-        extracted = tmp_path / "extracted" / "neo4j-mcp"
-        extracted.parent.mkdir(parents=True)
-        extracted.write_bytes(b"existing binary")
-        mock_extracted_path.return_value = extracted
-        
-        final_path, version, extracted_bin = install_binary(force_download=False)
+        mock_sha.assert_called_once()
+        assert installer_env._http_download.call_count == 2
+        assert installer_env.archive.read_bytes() == b"fake archive"
+
+    @pytest.mark.parametrize("mode", [None, "crc32"], ids=["stat", "crc32"])
+    def test_install_binary_cache_verify_crc(self, installer_env, monkeypatch, mode):
+        """Test NEO4J_MCP_CACHE_VERIFY=crc32 catches a cached archive corrupted in place."""
+        if mode:
+            monkeypatch.setenv("NEO4J_MCP_CACHE_VERIFY", mode)
+        sha = hashlib.sha256(b"fake archive").hexdigest()
+        installer_env._download_checksums_text.return_value = f"neo4j-mcp_Linux_x86_64.tar.gz\nsha256:{sha}\n"
+        install_binary(verify=True)
+        self._corrupt_in_place(installer_env.archive)
+        # a missing extracted binary sends the next install to the cached archive
+        installer_env.extracted.unlink()
+        mock_sha = Mock(spec=_sha256_file, wraps=_sha256_file)
+        monkeypatch.setattr(installer, "_sha256_file", mock_sha)
+        
+        install_binary(verify=True)
+        
+        if mode:
+            # the CRC mismatch forces a full rehash, which fails, so it's fetched again
+            mock_sha.assert_called_once()
+            assert installer_env._http_download.call_count == 2
+            assert installer_env.archive.read_bytes() == b"fake archive"
+        else:
+            # by default an unchanged size + mtime is trusted without reading the file
+            mock_sha.assert_not_called()
+            installer_env._http_download.assert_called_once()
+
+    def test_install_binary_verification_fails(self, installer_env, monkeypatch):
+        """Test install_binary fails when checksum doesn't match."""
+        monkeypatch.setattr(
+            installer, "_expected_sha_from_checksums", MagicMock(return_value="expected_hash_12345")
+        )
+        installer_env._download_checksums_text.return_value = "checksum data"
         
-        # Should not download or extract again
-        mock_download.assert_not_called()
-        mock_extract.assert_not_called()
-        # But final path should exist
-        assert final_path.exists()
+        with pytest.raises(RuntimeError, match="Checksum verification failed"):
+            install_binary(verify=True)
+        installer_env._extract_archive.assert_not_called()
+
+    def test_install_binary_unverified_streams_archive(self, installer_env, monkeypatch):
+        """Test an unverified install extracts from the response without saving the archive."""
+        mock_stream = MagicMock(side_effect=lambda url, out_bin, target, **kwargs: out_bin.write_bytes(b"fake binary"))
+        monkeypatch.setattr(installer, "_download_and_extract", mock_stream)
+        
+        final_path, version, extracted_bin = install_binary(verify=False)
+        
+        mock_stream.assert_called_once()
+        assert mock_stream.call_args.args[:3] == (
+            f"{DEFAULT_BASE_URL}/v1.0.0/neo4j-mcp_Linux_x86_64.tar.gz", installer_env.extracted, installer_env.target
+        )
+        installer_env._http_download.assert_not_called()
+        assert not installer_env.archive.exists()
+        assert final_path.read_bytes() == b"fake binary"
+
+    def test_install_binaries(self, installer_env, monkeypatch, tmp_path):
+        """Test install_binaries pre-hashes cached archives, then installs each version."""
+        for v in ("v1.0.0", "v1.1.0"):
+            (tmp_path / v).mkdir()
+            (tmp_path / v / "archive.tar.gz").write_bytes(b"cached archive")
+        (tmp_path / "v1.1.0" / "neo4j-mcp").write_bytes(b"already extracted")
+        installer_env.archive_path.side_effect = lambda v, t: tmp_path / v / "archive.tar.gz"
+        installer_env.extracted_path.side_effect = lambda v, t: tmp_path / v / "neo4j-mcp"
+        mock_parallel = MagicMock()
+        monkeypatch.setattr(installer, "_sha256_files_parallel", mock_parallel)
+        mock_install = MagicMock(
+            side_effect=lambda version, **kwargs: (tmp_path / "neo4j-mcp", version, tmp_path / version / "neo4j-mcp")
+        )
+        monkeypatch.setattr(installer, "install_binary", mock_install)
+        
+        results = install_binaries(["v1.0.0", "v1.1.0", "v1.2.0"], install_dir=tmp_path)
+        
+        # only v1.0.0 has an archive that install_binary will go on to check
+        mock_parallel.assert_called_once_with([tmp_path / "v1.0.0" / "archive.tar.gz"])
+        assert [r[1] for r in results] == ["v1.0.0", "v1.1.0", "v1.2.0"]
+        assert [c.kwargs["version"] for c in mock_install.call_args_list] == ["v1.0.0", "v1.1.0", "v1.2.0"]
+        assert all(c.kwargs["install_dir"] == tmp_path for c in mock_install.call_args_list)